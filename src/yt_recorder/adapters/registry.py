@@ -3,7 +3,7 @@ from __future__ import annotations
 import fcntl
 import os
 import tempfile
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from datetime import date
 from pathlib import Path
@@ -40,6 +40,9 @@ class MarkdownRegistryStore:
         """
         self.registry_path = registry_path
         self.account_names = account_names
+        # (mtime_ns, size, inode) of the file last parsed, and its entries.
+        # Atomic writes replace the inode, so any write invalidates the key.
+        self._parse_cache: tuple[tuple[int, int, int], list[RegistryEntry]] | None = None
 
     def load(self) -> list[RegistryEntry]:
         """Load all entries from registry.
@@ -51,11 +54,27 @@ class MarkdownRegistryStore:
             RegistryFileNotFoundError: If registry file doesn't exist
             RegistryParseError: If registry file is malformed
         """
-        if not self.registry_path.exists():
-            raise RegistryFileNotFoundError(f"Registry file not found: {self.registry_path}")
+        try:
+            st = self.registry_path.stat()
+        except FileNotFoundError:
+            raise RegistryFileNotFoundError(
+                f"Registry file not found: {self.registry_path}"
+            ) from None
+        except OSError as e:
+            raise RegistryParseError(f"Failed to read registry: {e}") from e
+
+        cache_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if self._parse_cache is not None and self._parse_cache[0] == cache_key:
+            return list(self._parse_cache[1])
 
+        entries = self._parse(self.registry_path)
+        self._parse_cache = (cache_key, entries)
+        return list(entries)
+
+    def _parse(self, path: Path) -> list[RegistryEntry]:
+        """Read and parse the registry table at path."""
         try:
-            content = self.registry_path.read_text(encoding="utf-8")
+            content = path.read_text(encoding="utf-8")
         except (OSError, UnicodeDecodeError) as e:
             raise RegistryParseError(f"Failed to read registry: {e}") from e
 
@@ -114,14 +133,31 @@ class MarkdownRegistryStore:
         Raises:
             RegistryWriteError: If write fails
         """
+        self.append_many([entry])
+
+    def append_many(self, entries: Iterable[RegistryEntry]) -> None:
+        """Append several entries to registry in one write.
+
+        Reads the file once, adds all rows in memory and does a single
+        atomic write, instead of one read/write cycle per entry.
+
+        Args:
+            entries: RegistryEntry objects to append, in order
+
+        Raises:
+            RegistryWriteError: If write fails
+        """
+        new_rows = [self._format_row(entry) for entry in entries]
+        if not new_rows:
+            return
+
         try:
             with self._locked():
                 if not self.registry_path.exists():
                     self._create_registry()
 
                 content = self.registry_path.read_text(encoding="utf-8")
-                new_row = self._format_row(entry)
-                new_content = content.rstrip() + "\n" + new_row + "\n"
+                new_content = content.rstrip() + "\n" + "\n".join(new_rows) + "\n"
 
                 self._atomic_write(new_content)
         except (OSError, UnicodeDecodeError) as e:
@@ -30,7 +30,7 @@ from yt_recorder.domain.models import (
     UploadResult,
 )
 from yt_recorder.domain.protocols import RegistryStore, TranscriptFetcher
-from yt_recorder.utils import safe_resolve
+from yt_recorder.utils import safe_resolve, safe_resolve_many
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +53,8 @@ class RecordingPipeline:
         self.registry = registry
         self.raid = raid
         self.transcriber = transcriber
+        # Deletion seam: tests swap this instead of patching Path.unlink globally
+        self._unlink: Callable[[Path], None] = lambda path: path.unlink()
 
     @classmethod
     def from_directory(cls, directory: Path, with_transcriber: bool = False) -> RecordingPipeline:
@@ -270,7 +272,7 @@ class RecordingPipeline:
 
                     if all_succeeded and not keep and not single_account:
                         try:
-                            path.unlink()
+                            self._unlink(path)
                             deleted_count += 1
                         except OSError as e:
                             errors.append(f"Failed to delete {path}: {e}")
@@ -651,8 +653,9 @@ class RecordingPipeline:
         splitter = VideoSplitter()
         registry_with_coverage = cast(MarkdownRegistryStore, self.registry)
 
-        for entry in entries:
-            path = safe_resolve(directory, entry.file)
+        paths = safe_resolve_many(directory, [entry.file for entry in entries])
+
+        for entry, path in zip(entries, paths):
             if not path.exists():
                 continue
 
@@ -688,7 +691,7 @@ class RecordingPipeline:
                 continue
 
             try:
-                path.unlink()
+                self._unlink(path)
                 temp_dir = path.parent / f".{path.stem}_parts"
                 if temp_dir.exists():
                     parts = sorted(temp_dir.glob(f"{path.stem}_part*{path.suffix}"))
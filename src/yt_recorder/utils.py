@@ -1,9 +1,24 @@
 """Utility functions for yt-recorder."""
 
-import platform
-import shutil
+import os
+from collections.abc import Iterable
 from pathlib import Path
 
+_DARWIN_PATHS: tuple[str, ...] = (
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    "/Applications/Chromium.app/Contents/MacOS/Chromium",
+)
+_LINUX_NAMES: tuple[str, ...] = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium-browser",
+    "chromium",
+)
+# Env vars instead of hard-coded C:\ paths: handles non-default drives
+# and per-user installs under %LOCALAPPDATA%
+_WINDOWS_ROOT_VARS: tuple[str, ...] = ("ProgramFiles", "ProgramFiles(x86)", "LOCALAPPDATA")
+_WINDOWS_CHROME_SUBPATH: tuple[str, ...] = ("Google", "Chrome", "Application", "chrome.exe")
+
 
 def safe_resolve(base: Path, untrusted: str) -> Path:
     """Resolve untrusted relative path, reject traversal attacks.
@@ -22,24 +37,51 @@ def safe_resolve(base: Path, untrusted: str) -> Path:
     Raises:
         ValueError: If resolved path escapes base directory or is absolute
     """
-    # Resolve both paths to absolute form
+    return _resolve_within(base.resolve(), untrusted)
+
+
+def safe_resolve_many(base: Path, untrusted: Iterable[str]) -> list[Path]:
+    """Resolve several untrusted relative paths against the same base.
+
+    Same checks as safe_resolve(), but the base directory is resolved once
+    for the whole batch instead of once per path.
+
+    Args:
+        base: Base directory (trusted, must be absolute)
+        untrusted: Relative paths from user input/registry
+
+    Returns:
+        Resolved absolute paths within base directory, in input order
+
+    Raises:
+        ValueError: If any resolved path escapes base directory or is absolute
+    """
     base_resolved = base.resolve()
+    return [_resolve_within(base_resolved, path) for path in untrusted]
+
+
+def _resolve_within(base_resolved: Path, untrusted: str) -> Path:
+    """Resolve untrusted path against an already-resolved base directory."""
     untrusted_path = Path(untrusted)
 
     # Reject absolute paths in untrusted input
     if untrusted_path.is_absolute():
         raise ValueError(f"Path traversal rejected: absolute path not allowed: {untrusted}")
 
-    # Resolve the untrusted path relative to base
+    # Resolve the untrusted path relative to base (follows symlinks)
     resolved = (base_resolved / untrusted_path).resolve()
 
-    # Verify resolved path is within base directory
+    # Verify resolved path is within base directory. commonpath is plain string
+    # math; it only raises for paths on different drives, which is an escape too.
+    base_str = str(base_resolved)
     try:
-        resolved.relative_to(base_resolved)
+        escapes = os.path.commonpath([base_str, str(resolved)]) != base_str
     except ValueError:
+        escapes = True
+    if escapes:
         raise ValueError(
             f"Path traversal rejected: {untrusted} escapes base directory {base_resolved}"
-        ) from None
+        )
 
     return resolved
 
@@ -50,35 +92,37 @@ def find_chrome() -> str:
     Searches for Chrome/Chromium in platform-specific locations:
     - macOS: /Applications/Google Chrome.app, /Applications/Chromium.app
     - Linux: google-chrome, google-chrome-stable, chromium-browser, chromium
-    - Windows: Program Files and Program Files (x86)
+    - Windows: %ProgramFiles%, %ProgramFiles(x86)% and %LOCALAPPDATA%
 
     Returns:
-        Path to Chrome/Chromium executable
+        Path to an executable Chrome/Chromium binary
 
     Raises:
         FileNotFoundError: If Chrome/Chromium not found with install instructions
     """
+    # Deferred: only needed at browser launch, keeps safe_resolve imports light
+    import platform
+    import shutil
+
     system = platform.system().lower()
     candidates: list[str] = []
 
     if system == "darwin":
-        candidates = [
-            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-            "/Applications/Chromium.app/Contents/MacOS/Chromium",
-        ]
+        candidates.extend(_DARWIN_PATHS)
     elif system == "linux":
-        for name in ("google-chrome", "google-chrome-stable", "chromium-browser", "chromium"):
+        for name in _LINUX_NAMES:
             found = shutil.which(name)
             if found:
                 candidates.append(found)
     elif system == "windows":
-        candidates = [
-            r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-            r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-        ]
+        for env_var in _WINDOWS_ROOT_VARS:
+            root = os.environ.get(env_var)
+            if root:
+                candidates.append(os.path.join(root, *_WINDOWS_CHROME_SUBPATH))
 
+    # X_OK also rejects a non-executable binary that would only fail at launch
     for path in candidates:
-        if Path(path).exists():
+        if os.access(path, os.X_OK):
             return path
 
     raise FileNotFoundError(
@@ -0,0 +1,31 @@
+"""Shared test doubles for pipeline tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from yt_recorder.domain.models import UploadResult
+
+# Frozen results shared by every test; the pipeline only reads them
+PRIMARY_RESULT = UploadResult("abc123", "https://youtu.be/abc123", "Test", "primary")
+MIRROR_RESULT = UploadResult("def456", "https://youtu.be/def456", "Test", "mirror")
+UPLOAD_OK: dict[str, UploadResult | None] = {"primary": PRIMARY_RESULT, "mirror": MIRROR_RESULT}
+
+
+class Recorder:
+    """Callable test double: records calls and returns a canned value."""
+
+    def __init__(
+        self,
+        return_value: Any = None,
+        side_effect: BaseException | type[BaseException] | None = None,
+    ) -> None:
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+from tests._doubles import UPLOAD_OK, Recorder
+from yt_recorder.config import Config
+from yt_recorder.domain.models import YouTubeAccount
+from yt_recorder.pipeline import RecordingPipeline
+
+
+@pytest.fixture
+def fake_dir(fs: FakeFilesystem) -> Path:
+    """Fresh empty directory on the pyfakefs in-memory filesystem.
+
+    Kept apart from tmp_path so a test's signature shows whether it touches disk.
+    """
+    return Path(tempfile.mkdtemp())
+
+
+@pytest.fixture(scope="class")
+def config() -> Config:
+    return Config(
+        accounts=[
+            YouTubeAccount("primary", Path("/tmp/p.json"), Path("/tmp/p.txt"), "primary"),
+            YouTubeAccount("mirror", Path("/tmp/m.json"), Path("/tmp/m.txt"), "mirror"),
+        ],
+        extensions=(".mp4",),
+        exclude_dirs=frozenset(),
+        max_depth=1,
+    )
+
+
+@pytest.fixture(scope="class")
+def pipeline_factory(config: Config) -> Callable[..., RecordingPipeline]:
+    """Build pipelines against the class's shared config."""
+
+    def _make(registry: Any, raid: Any, transcriber: Any = None) -> RecordingPipeline:
+        return RecordingPipeline(config, registry, raid, transcriber)
+
+    return _make
+
+
+@pytest.fixture
+def mock_registry() -> SimpleNamespace:
+    return SimpleNamespace(
+        load=Recorder(return_value=[]),
+        append=Recorder(),
+        update_many=Recorder(),
+        update_account_id=Recorder(),
+        get_parts_for_parent=Recorder(return_value=[]),
+        is_account_covered=Recorder(return_value=True),
+    )
+
+
+@pytest.fixture
+def mock_raid() -> SimpleNamespace:
+    return SimpleNamespace(
+        open=Recorder(),
+        close=Recorder(),
+        upload=Recorder(return_value=(UPLOAD_OK, 0)),
+        get_adapter=Recorder(),
+        _adapters={
+            "primary": SimpleNamespace(upload=Recorder(), assign_playlist=Recorder()),
+            "mirror": SimpleNamespace(upload=Recorder(), assign_playlist=Recorder()),
+        },
+    )
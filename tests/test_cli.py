@@ -18,212 +18,207 @@ from yt_recorder.domain.models import (
     YouTubeAccount,
 )
 
+_EMPTY_SYNC = SyncReport()
+_EMPTY_CLEAN = CleanReport()
+
 
 @pytest.fixture
 def runner() -> CliRunner:
     return CliRunner()
 
 
+@pytest.fixture
+def mock_from_directory(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    factory = Mock(return_value=Mock())
+    monkeypatch.setattr("yt_recorder.pipeline.RecordingPipeline.from_directory", factory)
+    return factory
+
+
+@pytest.fixture
+def mock_pipeline(mock_from_directory: Mock) -> Mock:
+    pipeline: Mock = mock_from_directory.return_value
+    return pipeline
+
+
 class TestUploadCommand:
-    def test_success(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.upload_new.return_value = SyncReport(
-                uploaded=3, upload_failed=0, deleted_count=2, kept_count=1
-            )
-            mock_from.return_value = mock_pipeline
+    def test_success(self, runner: CliRunner, tmp_path: Path, mock_pipeline: Mock) -> None:
+        mock_pipeline.upload_new.return_value = SyncReport(
+            uploaded=3, upload_failed=0, deleted_count=2, kept_count=1
+        )
 
-            result = runner.invoke(main, ["upload", str(tmp_path)])
+        result = runner.invoke(main, ["upload", str(tmp_path)])
 
-            assert result.exit_code == 0
-            assert "Uploaded: 3" in result.output
-            assert "Failed: 0" in result.output
-            assert "Deleted: 2" in result.output
-            assert "Kept: 1" in result.output
+        assert result.exit_code == 0
+        assert "Uploaded: 3" in result.output
+        assert "Failed: 0" in result.output
+        assert "Deleted: 2" in result.output
+        assert "Kept: 1" in result.output
 
-    def test_dry_run(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.upload_new.return_value = SyncReport(skipped=5)
-            mock_from.return_value = mock_pipeline
+    def test_dry_run(self, runner: CliRunner, tmp_path: Path, mock_pipeline: Mock) -> None:
+        mock_pipeline.upload_new.return_value = SyncReport(skipped=5)
 
-            result = runner.invoke(main, ["upload", str(tmp_path), "--dry-run"])
+        result = runner.invoke(main, ["upload", str(tmp_path), "--dry-run"])
 
-            assert result.exit_code == 0
-            assert "Would upload 5 files" in result.output
+        assert result.exit_code == 0
+        assert "Would upload 5 files" in result.output
 
-    def test_with_errors(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.upload_new.return_value = SyncReport(
-                uploaded=1, upload_failed=1, errors=["Failed: timeout"]
-            )
-            mock_from.return_value = mock_pipeline
-
-            result = runner.invoke(main, ["upload", str(tmp_path)])
-
-            assert "Errors:" in result.output
-            assert "timeout" in result.output
-
-    def test_passes_all_options(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.upload_new.return_value = SyncReport()
-            mock_from.return_value = mock_pipeline
-
-            result = runner.invoke(
-                main,
-                [
-                    "upload",
-                    str(tmp_path),
-                    "--limit",
-                    "5",
-                    "--account",
-                    "backup",
-                    "--keep",
-                    "--retry-failed",
-                ],
-            )
+    def test_with_errors(self, runner: CliRunner, tmp_path: Path, mock_pipeline: Mock) -> None:
+        mock_pipeline.upload_new.return_value = SyncReport(
+            uploaded=1, upload_failed=1, errors=["Failed: timeout"]
+        )
 
-            assert result.exit_code == 0
-            mock_pipeline.upload_new.assert_called_once_with(
-                directory=tmp_path,
-                limit=5,
-                dry_run=False,
-                keep=True,
-                retry_failed=True,
-                single_account="backup",
-            )
+        result = runner.invoke(main, ["upload", str(tmp_path)])
+
+        assert "Errors:" in result.output
+        assert "timeout" in result.output
+
+    def test_passes_all_options(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        mock_pipeline: Mock,
+    ) -> None:
+        mock_pipeline.upload_new.return_value = _EMPTY_SYNC
+        result = runner.invoke(
+            main,
+            [
+                "upload",
+                str(tmp_path),
+                "--limit",
+                "5",
+                "--account",
+                "backup",
+                "--keep",
+                "--retry-failed",
+            ],
+        )
+
+        assert result.exit_code == 0
+        mock_pipeline.upload_new.assert_called_once_with(
+            directory=tmp_path,
+            limit=5,
+            dry_run=False,
+            keep=True,
+            retry_failed=True,
+            single_account="backup",
+        )
 
 
 class TestTranscribeCommand:
-    def test_success(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.fetch_transcripts.return_value = SyncReport(
-                transcripts_fetched=3, transcripts_pending=2
-            )
-            mock_from.return_value = mock_pipeline
+    def test_success(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        mock_from_directory: Mock,
+        mock_pipeline: Mock,
+    ) -> None:
+        mock_pipeline.fetch_transcripts.return_value = SyncReport(
+            transcripts_fetched=3, transcripts_pending=2
+        )
 
-            result = runner.invoke(main, ["transcribe", str(tmp_path)])
+        result = runner.invoke(main, ["transcribe", str(tmp_path)])
 
-            assert result.exit_code == 0
-            assert "Transcripts fetched: 3" in result.output
-            assert "Pending (not ready): 2" in result.output
-            mock_from.assert_called_once_with(tmp_path, with_transcriber=True)
-
-    def test_with_errors(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.fetch_transcripts.return_value = SyncReport(
-                errors=["No transcript for video.mp4"]
-            )
-            mock_from.return_value = mock_pipeline
+        assert result.exit_code == 0
+        assert "Transcripts fetched: 3" in result.output
+        assert "Pending (not ready): 2" in result.output
+        mock_from_directory.assert_called_once_with(tmp_path, with_transcriber=True)
 
-            result = runner.invoke(main, ["transcribe", str(tmp_path)])
+    def test_with_errors(self, runner: CliRunner, tmp_path: Path, mock_pipeline: Mock) -> None:
+        mock_pipeline.fetch_transcripts.return_value = SyncReport(
+            errors=["No transcript for video.mp4"]
+        )
+
+        result = runner.invoke(main, ["transcribe", str(tmp_path)])
 
-            assert "Errors:" in result.output
+        assert "Errors:" in result.output
 
-    def test_passes_retry_force(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.fetch_transcripts.return_value = SyncReport()
-            mock_from.return_value = mock_pipeline
+    def test_passes_retry_force(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        mock_pipeline: Mock,
+    ) -> None:
+        mock_pipeline.fetch_transcripts.return_value = _EMPTY_SYNC
 
-            runner.invoke(main, ["transcribe", str(tmp_path), "--retry", "--force"])
+        runner.invoke(main, ["transcribe", str(tmp_path), "--retry", "--force"])
 
-            mock_pipeline.fetch_transcripts.assert_called_once_with(
-                tmp_path, retry=True, force=True
-            )
+        mock_pipeline.fetch_transcripts.assert_called_once_with(tmp_path, retry=True, force=True)
 
 
 class TestSyncCommand:
-    def test_success(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.upload_new.return_value = SyncReport(uploaded=2)
-            mock_pipeline.fetch_transcripts.return_value = SyncReport(
-                transcripts_fetched=1, transcripts_pending=1
-            )
-            mock_from.return_value = mock_pipeline
+    def test_success(self, runner: CliRunner, tmp_path: Path, mock_pipeline: Mock) -> None:
+        mock_pipeline.upload_new.return_value = SyncReport(uploaded=2)
+        mock_pipeline.fetch_transcripts.return_value = SyncReport(
+            transcripts_fetched=1, transcripts_pending=1
+        )
 
-            result = runner.invoke(main, ["sync", str(tmp_path)])
+        result = runner.invoke(main, ["sync", str(tmp_path)])
 
-            assert result.exit_code == 0
-            assert "Uploaded: 2" in result.output
-            assert "Fetched: 1" in result.output
+        assert result.exit_code == 0
+        assert "Uploaded: 2" in result.output
+        assert "Fetched: 1" in result.output
 
-    def test_dry_run_skips_transcripts(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.upload_new.return_value = SyncReport(skipped=3)
-            mock_from.return_value = mock_pipeline
+    def test_dry_run_skips_transcripts(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        mock_pipeline: Mock,
+    ) -> None:
+        mock_pipeline.upload_new.return_value = SyncReport(skipped=3)
 
-            result = runner.invoke(main, ["sync", str(tmp_path), "--dry-run"])
+        result = runner.invoke(main, ["sync", str(tmp_path), "--dry-run"])
 
-            assert "Would upload 3 files" in result.output
-            mock_pipeline.fetch_transcripts.assert_not_called()
+        assert "Would upload 3 files" in result.output
+        mock_pipeline.fetch_transcripts.assert_not_called()
 
-    def test_shows_caption_note_on_upload(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.upload_new.return_value = SyncReport(uploaded=1)
-            mock_pipeline.fetch_transcripts.return_value = SyncReport()
-            mock_from.return_value = mock_pipeline
+    def test_shows_caption_note_on_upload(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        mock_pipeline: Mock,
+    ) -> None:
+        mock_pipeline.upload_new.return_value = SyncReport(uploaded=1)
+        mock_pipeline.fetch_transcripts.return_value = _EMPTY_SYNC
 
-            result = runner.invoke(main, ["sync", str(tmp_path)])
+        result = runner.invoke(main, ["sync", str(tmp_path)])
 
-            assert "auto-captions" in result.output
+        assert "auto-captions" in result.output
 
 
 class TestCleanCommand:
-    def test_success(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.clean_synced.return_value = CleanReport(deleted=3, skipped=1)
-            mock_from.return_value = mock_pipeline
+    def test_success(self, runner: CliRunner, tmp_path: Path, mock_pipeline: Mock) -> None:
+        mock_pipeline.clean_synced.return_value = CleanReport(deleted=3, skipped=1)
 
-            result = runner.invoke(main, ["clean", str(tmp_path)])
+        result = runner.invoke(main, ["clean", str(tmp_path)])
 
-            assert result.exit_code == 0
-            assert "Deleted: 3" in result.output
-            assert "Skipped: 1" in result.output
-
-    def test_dry_run(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.clean_synced.return_value = CleanReport(
-                eligible=["video1.mp4", "video2.mp4"]
-            )
-            mock_from.return_value = mock_pipeline
+        assert result.exit_code == 0
+        assert "Deleted: 3" in result.output
+        assert "Skipped: 1" in result.output
 
-            result = runner.invoke(main, ["clean", str(tmp_path), "--dry-run"])
+    def test_dry_run(self, runner: CliRunner, tmp_path: Path, mock_pipeline: Mock) -> None:
+        mock_pipeline.clean_synced.return_value = CleanReport(eligible=["video1.mp4", "video2.mp4"])
 
-            assert "Would delete 2 files" in result.output
-            assert "video1.mp4" in result.output
+        result = runner.invoke(main, ["clean", str(tmp_path), "--dry-run"])
 
-    def test_dry_run_empty(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.clean_synced.return_value = CleanReport()
-            mock_from.return_value = mock_pipeline
+        assert "Would delete 2 files" in result.output
+        assert "video1.mp4" in result.output
 
-            result = runner.invoke(main, ["clean", str(tmp_path), "--dry-run"])
+    def test_dry_run_empty(self, runner: CliRunner, tmp_path: Path, mock_pipeline: Mock) -> None:
+        mock_pipeline.clean_synced.return_value = _EMPTY_CLEAN
 
-            assert "No files eligible" in result.output
+        result = runner.invoke(main, ["clean", str(tmp_path), "--dry-run"])
 
-    def test_with_errors(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.clean_synced.return_value = CleanReport(
-                errors=["Failed to delete video.mp4: Permission denied"]
-            )
-            mock_from.return_value = mock_pipeline
+        assert "No files eligible" in result.output
+
+    def test_with_errors(self, runner: CliRunner, tmp_path: Path, mock_pipeline: Mock) -> None:
+        mock_pipeline.clean_synced.return_value = CleanReport(
+            errors=["Failed to delete video.mp4: Permission denied"]
+        )
 
-            result = runner.invoke(main, ["clean", str(tmp_path)])
+        result = runner.invoke(main, ["clean", str(tmp_path)])
 
-            assert "Errors" in result.output
-            assert "Permission denied" in result.output
+        assert "Errors" in result.output
+        assert "Permission denied" in result.output
 
 
 class TestStatusCommand:
@@ -300,18 +295,15 @@ class TestPlaylistCommand:
         assert "--dry-run" in result.output
         assert "--account" in result.output
 
-    def test_playlist_dry_run(self, runner: CliRunner, tmp_path: Path) -> None:
-        with patch("yt_recorder.pipeline.RecordingPipeline.from_directory") as mock_from:
-            mock_pipeline = Mock()
-            mock_pipeline.assign_playlists.return_value = PlaylistReport(
-                assigned=5, failed=0, skipped=2
-            )
-            mock_from.return_value = mock_pipeline
+    def test_playlist_dry_run(self, runner: CliRunner, tmp_path: Path, mock_pipeline: Mock) -> None:
+        mock_pipeline.assign_playlists.return_value = PlaylistReport(
+            assigned=5, failed=0, skipped=2
+        )
 
-            result = runner.invoke(main, ["playlist", str(tmp_path), "--dry-run"])
+        result = runner.invoke(main, ["playlist", str(tmp_path), "--dry-run"])
 
-            assert result.exit_code == 0
-            assert "Would assign" in result.output
+        assert result.exit_code == 0
+        assert "Would assign" in result.output
 
     def test_playlist_single_video(self, runner: CliRunner) -> None:
         with (
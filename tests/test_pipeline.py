@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import date
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from typing import Any, Callable
 
 import pytest
 
+from tests._doubles import UPLOAD_OK, Recorder
 from yt_recorder.config import Config
 from yt_recorder.domain.exceptions import (
     ChannelCreationRequiredError,
@@ -16,154 +19,121 @@ from yt_recorder.domain.exceptions import (
 from yt_recorder.domain.models import RegistryEntry, TranscriptStatus, UploadResult, YouTubeAccount
 from yt_recorder.pipeline import RecordingPipeline
 
+_TODAY = date.today()
+
 
 class TestRecordingPipeline:
     """Test suite for RecordingPipeline."""
 
-    @pytest.fixture
-    def config(self) -> Config:
-        return Config(
-            accounts=[
-                YouTubeAccount("primary", Path("/tmp/p.json"), Path("/tmp/p.txt"), "primary"),
-                YouTubeAccount("mirror", Path("/tmp/m.json"), Path("/tmp/m.txt"), "mirror"),
-            ],
-            extensions=(".mp4",),
-            exclude_dirs=frozenset(),
-            max_depth=1,
-        )
-
-    @pytest.fixture
-    def mock_registry(self) -> Mock:
-        registry = Mock()
-        registry.load = Mock(return_value=[])
-        registry.get_parts_for_parent = Mock(return_value=[])
-        registry.is_account_covered = Mock(return_value=True)
-        return registry
-
-    @pytest.fixture
-    def mock_raid(self) -> Mock:
-        raid = Mock()
-        raid.open = Mock()
-        raid.close = Mock()
-        raid.upload = Mock(
-            return_value=(
-                {
-                    "primary": UploadResult("abc123", "https://youtu.be/abc123", "Test", "primary"),
-                    "mirror": UploadResult("def456", "https://youtu.be/def456", "Test", "mirror"),
-                },
+    @pytest.mark.parametrize(
+        ("kwargs", "files", "registered", "upload_results", "expected", "upload_calls"),
+        [
+            pytest.param(
+                {"dry_run": True},
+                ["test.mp4"],
+                [],
+                None,
+                {"skipped": 1},
                 0,
-            )
-        )
-        raid._adapters = {
-            "primary": Mock(),
-            "mirror": Mock(),
-        }
-        return raid
-
-    def test_upload_new_dry_run(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
-    ) -> None:
-        """Test dry-run mode doesn't upload."""
-        # Create test file
-        (tmp_path / "test.mp4").write_text("fake video")
-
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.upload_new(tmp_path, dry_run=True)
-
-        assert report.skipped == 1
-        mock_raid.open.assert_not_called()
-
-    def test_upload_new_uploads_file(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
-    ) -> None:
-        """Test successful upload."""
-        (tmp_path / "test.mp4").write_text("fake video")
-
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.upload_new(tmp_path)
-
-        assert report.uploaded == 1
-        assert report.deleted_count == 1  # File deleted after successful upload
-        mock_registry.append.assert_called_once()
-
-    def test_upload_new_with_limit(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
-    ) -> None:
-        """Test limit parameter."""
-        (tmp_path / "test1.mp4").write_text("fake")
-        (tmp_path / "test2.mp4").write_text("fake")
-
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.upload_new(tmp_path, limit=1)
-
-        assert report.uploaded == 1
-        assert mock_raid.upload.call_count == 1
-
-    def test_upload_new_keeps_file_on_failure(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
-    ) -> None:
-        """Test file is kept if any mirror fails."""
-        (tmp_path / "test.mp4").write_text("fake video")
-        mock_raid.upload = Mock(
-            return_value=(
-                {
-                    "primary": UploadResult("abc123", "https://youtu.be/abc123", "Test", "primary"),
-                    "mirror": None,
-                },
+                id="dry_run",
+            ),
+            pytest.param(
+                {},
+                ["test.mp4"],
+                [],
+                None,
+                {"uploaded": 1, "deleted_count": 1},
+                1,
+                id="uploads_file",
+            ),
+            pytest.param(
+                {"limit": 1},
+                ["test1.mp4", "test2.mp4"],
+                [],
+                None,
+                {"uploaded": 1},
+                1,
+                id="with_limit",
+            ),
+            pytest.param(
+                {},
+                ["test.mp4"],
+                [],
+                {**UPLOAD_OK, "mirror": None},
+                {"uploaded": 1, "kept_count": 1, "deleted_count": 0},
+                1,
+                id="keeps_file_on_failure",
+            ),
+            pytest.param(
+                {"keep": True},
+                ["test.mp4"],
+                [],
+                None,
+                {"uploaded": 1, "kept_count": 1, "deleted_count": 0},
+                1,
+                id="with_keep_flag",
+            ),
+            pytest.param(
+                {},
+                ["test.mp4"],
+                ["test.mp4"],
+                None,
+                {"uploaded": 0},
                 0,
-            )
-        )
-
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.upload_new(tmp_path)
-
-        assert report.uploaded == 1
-        assert report.kept_count == 1  # Kept because mirror failed
-        assert report.deleted_count == 0
-
-    def test_upload_new_with_keep_flag(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
-    ) -> None:
-        """Test --keep flag preserves files."""
-        (tmp_path / "test.mp4").write_text("fake video")
-
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.upload_new(tmp_path, keep=True)
-
-        assert report.uploaded == 1
-        assert report.kept_count == 1
-        assert report.deleted_count == 0
-
-    def test_upload_new_skips_registered(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
-    ) -> None:
-        """Test already-registered files are skipped."""
-        (tmp_path / "test.mp4").write_text("fake video")
-        mock_registry.load = Mock(
-            return_value=[RegistryEntry("test.mp4", "", date.today(), TranscriptStatus.PENDING, {})]
-        )
-
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.upload_new(tmp_path)
+                id="skips_registered",
+            ),
+            pytest.param(
+                {},
+                [],
+                [],
+                None,
+                {"uploaded": 0},
+                0,
+                id="no_files_skips_browser_launch",
+            ),
+        ],
+    )
+    def test_upload_new(
+        self,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
+        kwargs: dict[str, Any],
+        files: list[str],
+        registered: list[str],
+        upload_results: dict[str, UploadResult | None] | None,
+        expected: dict[str, int],
+        upload_calls: int,
+    ) -> None:
+        """upload_new report and side effects across flag/registry combinations."""
+        for name in files:
+            (fake_dir / name).write_text("fake video")
+        mock_registry.load.return_value = [
+            RegistryEntry(name, "", _TODAY, TranscriptStatus.PENDING, {}) for name in registered
+        ]
+        if upload_results is not None:
+            mock_raid.upload.return_value = (upload_results, 0)
 
-        assert report.uploaded == 0
-        mock_raid.upload.assert_not_called()
+        pipeline = pipeline_factory(mock_registry, mock_raid)
+        report = pipeline.upload_new(fake_dir, **kwargs)
 
-    def test_upload_no_files_skips_browser_launch(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
-    ) -> None:
-        """H5: No browsers opened when 0 files to process."""
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.upload_new(tmp_path)
-
-        assert report.uploaded == 0
-        mock_raid.open.assert_not_called()
+        for attr, value in expected.items():
+            assert getattr(report, attr) == value, attr
+        assert len(mock_raid.upload.calls) == upload_calls
+        # Browsers are only launched when there is something to upload
+        assert len(mock_raid.open.calls) == (1 if upload_calls else 0)
+        assert len(mock_registry.append.calls) == upload_calls
 
     def test_retry_failed_re_uploads_dashed_accounts(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
+        self,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         """C2: --retry-failed re-uploads to accounts with '—'."""
-        (tmp_path / "test.mp4").write_text("fake video")
+        (fake_dir / "test.mp4").write_text("fake video")
         mirror_adapter = mock_raid._adapters["mirror"]
         mirror_adapter.upload.return_value = UploadResult(
             "new456",
@@ -172,102 +142,89 @@ class TestRecordingPipeline:
             "mirror",
         )
 
-        mock_registry.load = Mock(
-            return_value=[
-                RegistryEntry(
-                    "test.mp4",
-                    "root",
-                    date.today(),
-                    TranscriptStatus.PENDING,
-                    {"primary": "abc123", "mirror": "—"},
-                )
-            ]
-        )
+        mock_registry.load.return_value = [
+            RegistryEntry(
+                "test.mp4",
+                "root",
+                _TODAY,
+                TranscriptStatus.PENDING,
+                {"primary": "abc123", "mirror": "—"},
+            )
+        ]
 
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.upload_new(tmp_path, retry_failed=True)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
+        report = pipeline.upload_new(fake_dir, retry_failed=True)
 
         assert report.uploaded == 1
-        mirror_adapter.upload.assert_called_once()
-        mirror_adapter.assign_playlist.assert_called_once_with("new456", "root")
-        mock_registry.update_account_id.assert_called_once_with(
-            "test.mp4",
-            "mirror",
-            "new456",
-        )
+        assert len(mirror_adapter.upload.calls) == 1
+        assert mirror_adapter.assign_playlist.calls == [(("new456", "root"), {})]
+        assert mock_registry.update_account_id.calls == [(("test.mp4", "mirror", "new456"), {})]
 
     def test_retry_failed_missing_file(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
+        self,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         """C2: retry reports error when local file is deleted."""
-        mock_registry.load = Mock(
-            return_value=[
-                RegistryEntry(
-                    "gone.mp4",
-                    "root",
-                    date.today(),
-                    TranscriptStatus.PENDING,
-                    {"primary": "abc123", "mirror": "—"},
-                )
-            ]
-        )
+        mock_registry.load.return_value = [
+            RegistryEntry(
+                "gone.mp4",
+                "root",
+                _TODAY,
+                TranscriptStatus.PENDING,
+                {"primary": "abc123", "mirror": "—"},
+            )
+        ]
 
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.upload_new(tmp_path, retry_failed=True)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
+        report = pipeline.upload_new(fake_dir, retry_failed=True)
 
         assert report.uploaded == 0
         assert any("file not found" in e for e in report.errors)
 
     def test_upload_new_aborts_on_channel_creation_gate(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
-    ) -> None:
-        (tmp_path / "test1.mp4").write_text("fake")
-        (tmp_path / "test2.mp4").write_text("fake")
-        blocked_adapter = Mock()
-        blocked_adapter.upload.side_effect = ChannelCreationRequiredError("channel required")
+        self,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
+    ) -> None:
+        (fake_dir / "test1.mp4").write_text("fake")
+        (fake_dir / "test2.mp4").write_text("fake")
+        blocked_adapter = SimpleNamespace(
+            upload=Recorder(side_effect=ChannelCreationRequiredError("channel required")),
+            assign_playlist=Recorder(),
+        )
         mock_raid.get_adapter.return_value = blocked_adapter
 
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.upload_new(tmp_path, single_account="primary")
+        pipeline = pipeline_factory(mock_registry, mock_raid)
+        report = pipeline.upload_new(fake_dir, single_account="primary")
 
-        assert blocked_adapter.upload.call_count == 1
+        assert len(blocked_adapter.upload.calls) == 1
         assert report.upload_failed == 1
         assert any("channel required" in error for error in report.errors)
 
 
 class TestFetchTranscripts:
-    @pytest.fixture
-    def config(self) -> Config:
-        return Config(
-            accounts=[
-                YouTubeAccount("primary", Path("/tmp/p.json"), Path("/tmp/p.txt"), "primary"),
-                YouTubeAccount("mirror", Path("/tmp/m.json"), Path("/tmp/m.txt"), "mirror"),
-            ],
-            extensions=(".mp4",),
-            exclude_dirs=frozenset(),
-            max_depth=1,
-            transcript_delay=0.0,
-        )
-
-    @pytest.fixture
-    def mock_registry(self) -> Mock:
-        registry = Mock()
-        registry.load = Mock(return_value=[])
-        registry.update_many = Mock()
-        return registry
-
-    @pytest.fixture
-    def mock_raid(self) -> Mock:
-        return Mock()
+    @pytest.fixture(scope="class")
+    def config(self, config: Config) -> Config:
+        return replace(config, transcript_delay=0.0)
 
     @pytest.fixture
-    def mock_transcriber(self, tmp_path: Path) -> Mock:
-        transcriber = Mock()
-        srt_path = tmp_path / ".tmp" / "test.srt"
-        srt_path.parent.mkdir(parents=True, exist_ok=True)
+    def mock_transcriber(self, fake_dir: Path) -> SimpleNamespace:
+        srt_path = fake_dir / "test.srt"
         srt_path.write_text("1\n00:00:00,000 --> 00:00:01,000\nHello world\n\n")
-        transcriber.fetch = Mock(return_value=srt_path)
-        return transcriber
+        return SimpleNamespace(fetch=Recorder(return_value=srt_path))
+
+    _PROTO = RegistryEntry(
+        file="video.mp4",
+        playlist="root",
+        uploaded_date=_TODAY,
+        transcript_status=TranscriptStatus.PENDING,
+        account_ids={"primary": "abc123", "mirror": "def456"},
+    )
 
     def _entry(
         self,
@@ -275,216 +232,210 @@ class TestFetchTranscripts:
         status: TranscriptStatus = TranscriptStatus.PENDING,
         video_id: str = "abc123",
     ) -> RegistryEntry:
-        return RegistryEntry(
+        return replace(
+            self._PROTO,
             file=file,
-            playlist="root",
-            uploaded_date=date.today(),
             transcript_status=status,
-            account_ids={"primary": video_id, "mirror": "def456"},
+            account_ids={**self._PROTO.account_ids, "primary": video_id},
         )
 
     def test_success_updates_to_done(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        mock_transcriber: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        mock_transcriber: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         mock_registry.load.return_value = [self._entry()]
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid, mock_transcriber)
+        pipeline = pipeline_factory(mock_registry, mock_raid, mock_transcriber)
 
-        report = pipeline.fetch_transcripts(tmp_path)
+        report = pipeline.fetch_transcripts(fake_dir)
 
         assert report.transcripts_fetched == 1
-        mock_registry.update_many.assert_called_once()
-        updates = mock_registry.update_many.call_args[0][0]
+        assert len(mock_registry.update_many.calls) == 1
+        updates = mock_registry.update_many.calls[-1][0][0]
         assert updates["video.mp4"]["transcript_status"] == TranscriptStatus.DONE
 
     def test_unavailable_updates_to_unavailable(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         mock_registry.load.return_value = [self._entry()]
-        transcriber = Mock()
-        transcriber.fetch.side_effect = TranscriptUnavailableError("No captions")
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid, transcriber)
+        transcriber = SimpleNamespace(
+            fetch=Recorder(side_effect=TranscriptUnavailableError("No captions"))
+        )
+        pipeline = pipeline_factory(mock_registry, mock_raid, transcriber)
 
-        report = pipeline.fetch_transcripts(tmp_path)
+        report = pipeline.fetch_transcripts(fake_dir)
 
         assert report.transcripts_fetched == 0
-        updates = mock_registry.update_many.call_args[0][0]
+        updates = mock_registry.update_many.calls[-1][0][0]
         assert updates["video.mp4"]["transcript_status"] == TranscriptStatus.UNAVAILABLE
 
     def test_not_ready_stays_pending(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         mock_registry.load.return_value = [self._entry()]
-        transcriber = Mock()
-        transcriber.fetch.side_effect = TranscriptNotReadyError("Processing")
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid, transcriber)
+        transcriber = SimpleNamespace(
+            fetch=Recorder(side_effect=TranscriptNotReadyError("Processing"))
+        )
+        pipeline = pipeline_factory(mock_registry, mock_raid, transcriber)
 
-        report = pipeline.fetch_transcripts(tmp_path)
+        report = pipeline.fetch_transcripts(fake_dir)
 
         assert report.transcripts_pending == 1
-        mock_registry.update_many.assert_not_called()
+        assert not mock_registry.update_many.calls
 
     def test_generic_exception_updates_to_error(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         mock_registry.load.return_value = [self._entry()]
-        transcriber = Mock()
-        transcriber.fetch.side_effect = RuntimeError("Connection timeout")
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid, transcriber)
+        transcriber = SimpleNamespace(
+            fetch=Recorder(side_effect=RuntimeError("Connection timeout"))
+        )
+        pipeline = pipeline_factory(mock_registry, mock_raid, transcriber)
 
-        report = pipeline.fetch_transcripts(tmp_path)
+        report = pipeline.fetch_transcripts(fake_dir)
 
-        updates = mock_registry.update_many.call_args[0][0]
+        updates = mock_registry.update_many.calls[-1][0][0]
         assert updates["video.mp4"]["transcript_status"] == TranscriptStatus.ERROR
         assert any("Connection timeout" in e for e in report.errors)
 
     def test_retry_flag_includes_error_state(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        mock_transcriber: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        mock_transcriber: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         mock_registry.load.return_value = [
             self._entry(status=TranscriptStatus.ERROR),
         ]
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid, mock_transcriber)
+        pipeline = pipeline_factory(mock_registry, mock_raid, mock_transcriber)
 
-        report_no_retry = pipeline.fetch_transcripts(tmp_path, retry=False)
+        report_no_retry = pipeline.fetch_transcripts(fake_dir, retry=False)
         assert report_no_retry.transcripts_fetched == 0
 
-        mock_registry.update_many.reset_mock()
+        mock_registry.update_many.calls.clear()
 
-        report_retry = pipeline.fetch_transcripts(tmp_path, retry=True)
+        report_retry = pipeline.fetch_transcripts(fake_dir, retry=True)
         assert report_retry.transcripts_fetched == 1
 
     def test_force_flag_processes_all(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        mock_transcriber: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        mock_transcriber: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         mock_registry.load.return_value = [
             self._entry(file="done.mp4", status=TranscriptStatus.DONE, video_id="d1"),
             self._entry(file="unavail.mp4", status=TranscriptStatus.UNAVAILABLE, video_id="u1"),
         ]
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid, mock_transcriber)
+        pipeline = pipeline_factory(mock_registry, mock_raid, mock_transcriber)
 
-        report = pipeline.fetch_transcripts(tmp_path, force=True)
+        report = pipeline.fetch_transcripts(fake_dir, force=True)
 
         assert report.transcripts_fetched == 2
 
     def test_no_primary_account(
         self,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         config = Config(
             accounts=[
                 YouTubeAccount("mirror", Path("/tmp/m.json"), Path("/tmp/m.txt"), "mirror"),
             ],
         )
-        transcriber = Mock()
+        transcriber = SimpleNamespace(fetch=Recorder())
         pipeline = RecordingPipeline(config, mock_registry, mock_raid, transcriber)
 
-        report = pipeline.fetch_transcripts(tmp_path)
+        report = pipeline.fetch_transcripts(fake_dir)
 
         assert "No primary account" in report.errors[0]
 
     def test_no_transcriber(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid, transcriber=None)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
 
-        report = pipeline.fetch_transcripts(tmp_path)
+        report = pipeline.fetch_transcripts(fake_dir)
 
         assert "Transcriber not initialized" in report.errors[0]
 
     def test_empty_registry(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         mock_registry.load.return_value = []
-        transcriber = Mock()
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid, transcriber)
+        transcriber = SimpleNamespace(fetch=Recorder())
+        pipeline = pipeline_factory(mock_registry, mock_raid, transcriber)
 
-        report = pipeline.fetch_transcripts(tmp_path)
+        report = pipeline.fetch_transcripts(fake_dir)
 
         assert report.transcripts_fetched == 0
         assert report.transcripts_pending == 0
 
     def test_batch_update_called_once(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        mock_transcriber: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        mock_transcriber: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         mock_registry.load.return_value = [
             self._entry(file="v1.mp4", video_id="id1"),
             self._entry(file="v2.mp4", video_id="id2"),
             self._entry(file="v3.mp4", video_id="id3"),
         ]
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid, mock_transcriber)
+        pipeline = pipeline_factory(mock_registry, mock_raid, mock_transcriber)
 
-        report = pipeline.fetch_transcripts(tmp_path)
+        report = pipeline.fetch_transcripts(fake_dir)
 
         assert report.transcripts_fetched == 3
-        mock_registry.update_many.assert_called_once()
-        updates = mock_registry.update_many.call_args[0][0]
+        assert len(mock_registry.update_many.calls) == 1
+        updates = mock_registry.update_many.calls[-1][0][0]
         assert len(updates) == 3
 
 
 class TestCleanSynced:
     @pytest.fixture
-    def config(self) -> Config:
-        return Config(
-            accounts=[
-                YouTubeAccount("primary", Path("/tmp/p.json"), Path("/tmp/p.txt"), "primary"),
-                YouTubeAccount("mirror", Path("/tmp/m.json"), Path("/tmp/m.txt"), "mirror"),
-            ],
-        )
-
-    @pytest.fixture
-    def mock_registry(self) -> Mock:
-        registry = Mock()
-        registry.load = Mock(return_value=[])
-        registry.get_parts_for_parent = Mock(return_value=[])
+    def mock_registry(self, mock_registry: SimpleNamespace) -> SimpleNamespace:
         # is_account_covered returns non-bool to trigger fallback to account_ids check
-        registry.is_account_covered = Mock(return_value=None)
-        return registry
+        mock_registry.is_account_covered.return_value = None
+        return mock_registry
 
-    @pytest.fixture
-    def mock_raid(self) -> Mock:
-        return Mock()
+    _PROTO = RegistryEntry(
+        file="video.mp4",
+        playlist="root",
+        uploaded_date=_TODAY,
+        transcript_status=TranscriptStatus.DONE,
+        account_ids={"primary": "abc123", "mirror": "def456"},
+    )
 
     def _entry(
         self,
@@ -492,204 +443,181 @@ class TestCleanSynced:
         status: TranscriptStatus = TranscriptStatus.DONE,
         accounts: dict[str, str] | None = None,
     ) -> RegistryEntry:
-        if accounts is None:
-            accounts = {"primary": "abc123", "mirror": "def456"}
-        return RegistryEntry(
+        return replace(
+            self._PROTO,
             file=file,
-            playlist="root",
-            uploaded_date=date.today(),
             transcript_status=status,
-            account_ids=accounts,
+            account_ids=self._PROTO.account_ids if accounts is None else accounts,
         )
 
     def test_deletes_when_all_accounts_and_done(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
-        (tmp_path / "video.mp4").write_text("data")
+        (fake_dir / "video.mp4").write_text("data")
         mock_registry.load.return_value = [self._entry()]
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
 
-        report = pipeline.clean_synced(tmp_path)
+        report = pipeline.clean_synced(fake_dir)
 
         assert report.deleted == 1
-        assert not (tmp_path / "video.mp4").exists()
+        assert not (fake_dir / "video.mp4").exists()
 
     def test_deletes_when_all_accounts_and_unavailable(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
-        (tmp_path / "video.mp4").write_text("data")
+        (fake_dir / "video.mp4").write_text("data")
         mock_registry.load.return_value = [self._entry(status=TranscriptStatus.UNAVAILABLE)]
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
 
-        report = pipeline.clean_synced(tmp_path)
+        report = pipeline.clean_synced(fake_dir)
 
         assert report.deleted == 1
 
     def test_skips_pending(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
-        (tmp_path / "video.mp4").write_text("data")
+        (fake_dir / "video.mp4").write_text("data")
         mock_registry.load.return_value = [self._entry(status=TranscriptStatus.PENDING)]
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
 
-        report = pipeline.clean_synced(tmp_path)
+        report = pipeline.clean_synced(fake_dir)
 
         assert report.deleted == 0
         assert report.skipped == 1
-        assert (tmp_path / "video.mp4").exists()
+        assert (fake_dir / "video.mp4").exists()
 
     def test_skips_error(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
-        (tmp_path / "video.mp4").write_text("data")
+        (fake_dir / "video.mp4").write_text("data")
         mock_registry.load.return_value = [self._entry(status=TranscriptStatus.ERROR)]
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
 
-        report = pipeline.clean_synced(tmp_path)
+        report = pipeline.clean_synced(fake_dir)
 
         assert report.deleted == 0
         assert report.skipped == 1
 
     def test_skips_missing_account(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
-        (tmp_path / "video.mp4").write_text("data")
+        (fake_dir / "video.mp4").write_text("data")
         mock_registry.load.return_value = [
             self._entry(accounts={"primary": "abc123", "mirror": "\u2014"})
         ]
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
 
-        report = pipeline.clean_synced(tmp_path)
+        report = pipeline.clean_synced(fake_dir)
 
         assert report.deleted == 0
         assert report.skipped == 1
 
     def test_skips_file_not_on_disk(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         mock_registry.load.return_value = [self._entry()]
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
 
-        report = pipeline.clean_synced(tmp_path)
+        report = pipeline.clean_synced(fake_dir)
 
         assert report.deleted == 0
 
     def test_dry_run_populates_eligible(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
-        (tmp_path / "video.mp4").write_text("data")
+        (fake_dir / "video.mp4").write_text("data")
         mock_registry.load.return_value = [self._entry()]
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
 
-        report = pipeline.clean_synced(tmp_path, dry_run=True)
+        report = pipeline.clean_synced(fake_dir, dry_run=True)
 
         assert report.eligible == ["video.mp4"]
         assert report.deleted == 0
-        assert (tmp_path / "video.mp4").exists()
+        assert (fake_dir / "video.mp4").exists()
 
     def test_oserror_reported_in_errors(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
-        (tmp_path / "video.mp4").write_text("data")
+        (fake_dir / "video.mp4").write_text("data")
         mock_registry.load.return_value = [self._entry()]
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
+
+        pipeline._unlink = Recorder(side_effect=OSError("Permission denied"))
 
-        with patch.object(Path, "unlink", side_effect=OSError("Permission denied")):
-            report = pipeline.clean_synced(tmp_path)
+        report = pipeline.clean_synced(fake_dir)
 
         assert len(report.errors) == 1
         assert "Permission denied" in report.errors[0]
 
     def test_empty_registry(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         mock_registry.load.return_value = []
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
 
-        report = pipeline.clean_synced(tmp_path)
+        report = pipeline.clean_synced(fake_dir)
 
         assert report.deleted == 0
         assert report.skipped == 0
 
     def test_missing_registry(
         self,
-        config: Config,
-        mock_registry: Mock,
-        mock_raid: Mock,
-        tmp_path: Path,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         mock_registry.load.side_effect = RegistryFileNotFoundError
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
 
-        report = pipeline.clean_synced(tmp_path)
+        report = pipeline.clean_synced(fake_dir)
 
         assert report.deleted == 0
 
 
 class TestAssignPlaylists:
     @pytest.fixture
-    def config(self) -> Config:
-        return Config(
-            accounts=[
-                YouTubeAccount("primary", Path("/tmp/p.json"), Path("/tmp/p.txt"), "primary"),
-                YouTubeAccount("mirror", Path("/tmp/m.json"), Path("/tmp/m.txt"), "mirror"),
-            ],
-            extensions=(".mp4",),
-            exclude_dirs=frozenset(),
-            max_depth=1,
+    def mock_raid(self, mock_raid: SimpleNamespace) -> SimpleNamespace:
+        mock_raid.get_adapter.return_value = SimpleNamespace(
+            assign_playlist=Recorder(return_value=True)
         )
-
-    @pytest.fixture
-    def mock_registry(self) -> Mock:
-        registry = Mock()
-        registry.load = Mock(return_value=[])
-        return registry
-
-    @pytest.fixture
-    def mock_raid(self) -> Mock:
-        raid = Mock()
-        raid.open = Mock()
-        raid.close = Mock()
-        adapter = Mock()
-        adapter.assign_playlist = Mock(return_value=True)
-        raid.get_adapter = Mock(return_value=adapter)
-        return raid
+        return mock_raid
 
     def _entry(
         self,
@@ -702,13 +630,17 @@ class TestAssignPlaylists:
         return RegistryEntry(
             file=file,
             playlist=playlist,
-            uploaded_date=date.today(),
+            uploaded_date=_TODAY,
             transcript_status=TranscriptStatus.PENDING,
             account_ids=account_ids,
         )
 
     def test_assign_playlists_success(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
+        self,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         """3 entries x 2 accounts = 6 assign_playlist calls."""
         mock_registry.load.return_value = [
@@ -718,18 +650,22 @@ class TestAssignPlaylists:
         ]
         adapter = mock_raid.get_adapter.return_value
 
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.assign_playlists(tmp_path)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
+        report = pipeline.assign_playlists(fake_dir)
 
         assert report.assigned == 6
         assert report.failed == 0
         assert report.skipped == 0
-        assert adapter.assign_playlist.call_count == 6
-        mock_raid.open.assert_called_once()
-        mock_raid.close.assert_called_once()
+        assert len(adapter.assign_playlist.calls) == 6
+        assert len(mock_raid.open.calls) == 1
+        assert len(mock_raid.close.calls) == 1
 
     def test_assign_playlists_dry_run(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
+        self,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         """Dry run: no browser opened, no assign_playlist called."""
         mock_registry.load.return_value = [
@@ -738,17 +674,21 @@ class TestAssignPlaylists:
         ]
         adapter = mock_raid.get_adapter.return_value
 
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.assign_playlists(tmp_path, dry_run=True)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
+        report = pipeline.assign_playlists(fake_dir, dry_run=True)
 
-        mock_raid.open.assert_not_called()
-        adapter.assign_playlist.assert_not_called()
+        assert not mock_raid.open.calls
+        assert not adapter.assign_playlist.calls
         assert report.assigned == 0
         assert report.failed == 0
         assert report.skipped == 0
 
     def test_assign_playlists_skips_missing_video_id(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
+        self,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         """Entry with video_id='—' is skipped."""
         mock_registry.load.return_value = [
@@ -756,15 +696,19 @@ class TestAssignPlaylists:
         ]
         adapter = mock_raid.get_adapter.return_value
 
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.assign_playlists(tmp_path)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
+        report = pipeline.assign_playlists(fake_dir)
 
         assert report.assigned == 1
         assert report.skipped == 1
-        assert adapter.assign_playlist.call_count == 1
+        assert len(adapter.assign_playlist.calls) == 1
 
     def test_assign_playlists_skips_empty_playlist(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
+        self,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         """Entry with empty playlist is skipped."""
         mock_registry.load.return_value = [
@@ -772,15 +716,19 @@ class TestAssignPlaylists:
         ]
         adapter = mock_raid.get_adapter.return_value
 
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.assign_playlists(tmp_path)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
+        report = pipeline.assign_playlists(fake_dir)
 
         assert report.skipped == 1
         assert report.assigned == 0
-        adapter.assign_playlist.assert_not_called()
+        assert not adapter.assign_playlist.calls
 
     def test_assign_playlists_single_account(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
+        self,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         """Only specified account is processed."""
         mock_registry.load.return_value = [
@@ -788,15 +736,19 @@ class TestAssignPlaylists:
         ]
         adapter = mock_raid.get_adapter.return_value
 
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.assign_playlists(tmp_path, single_account="primary")
+        pipeline = pipeline_factory(mock_registry, mock_raid)
+        report = pipeline.assign_playlists(fake_dir, single_account="primary")
 
         assert report.assigned == 1
-        assert adapter.assign_playlist.call_count == 1
-        adapter.assign_playlist.assert_called_with("abc123", "test-playlist")
+        assert len(adapter.assign_playlist.calls) == 1
+        assert adapter.assign_playlist.calls[-1] == (("abc123", "test-playlist"), {})
 
     def test_assign_playlists_failure_counted(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
+        self,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         """Adapter returns False → report.failed incremented."""
         mock_registry.load.return_value = [
@@ -805,15 +757,19 @@ class TestAssignPlaylists:
         adapter = mock_raid.get_adapter.return_value
         adapter.assign_playlist.return_value = False
 
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.assign_playlists(tmp_path)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
+        report = pipeline.assign_playlists(fake_dir)
 
         assert report.failed == 1
         assert report.assigned == 0
         assert len(report.errors) == 1
 
     def test_assign_playlists_exception_handling(
-        self, config: Config, mock_registry: Mock, mock_raid: Mock, tmp_path: Path
+        self,
+        pipeline_factory: Callable[..., RecordingPipeline],
+        mock_registry: SimpleNamespace,
+        mock_raid: SimpleNamespace,
+        fake_dir: Path,
     ) -> None:
         """Adapter raises exception → error captured in report.errors."""
         mock_registry.load.return_value = [
@@ -822,8 +778,8 @@ class TestAssignPlaylists:
         adapter = mock_raid.get_adapter.return_value
         adapter.assign_playlist.side_effect = RuntimeError("Network error")
 
-        pipeline = RecordingPipeline(config, mock_registry, mock_raid)
-        report = pipeline.assign_playlists(tmp_path)
+        pipeline = pipeline_factory(mock_registry, mock_raid)
+        report = pipeline.assign_playlists(fake_dir)
 
         assert report.failed == 1
         assert report.assigned == 0
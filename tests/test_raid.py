@@ -1,13 +1,110 @@
 from __future__ import annotations
 
+import inspect
+import re
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Callable, cast
 from unittest.mock import Mock
 
 import pytest
 
 from yt_recorder.adapters.raid import RaidAdapter
 from yt_recorder.domain.models import UploadResult, YouTubeAccount
+from yt_recorder.domain.protocols import VideoUploader
+
+# YouTubeAccount is frozen, so one list serves every test
+_ACCOUNTS: list[YouTubeAccount] = [
+    YouTubeAccount(
+        name="primary",
+        storage_state=Path("/tmp/primary.json"),
+        cookies_path=Path("/tmp/primary.txt"),
+        role="primary",
+    ),
+    YouTubeAccount(
+        name="mirror-1",
+        storage_state=Path("/tmp/mirror1.json"),
+        cookies_path=Path("/tmp/mirror1.txt"),
+        role="mirror",
+    ),
+    YouTubeAccount(
+        name="mirror-2",
+        storage_state=Path("/tmp/mirror2.json"),
+        cookies_path=Path("/tmp/mirror2.txt"),
+        role="mirror",
+    ),
+]
+
+_EMPTY_ACCOUNTS_RE = re.compile(r"No accounts configured")
+_NO_PRIMARY_RE = re.compile(r"No primary account found")
+
+
+def _make_raid(factory: Callable[[YouTubeAccount, Any], Any]) -> RaidAdapter:
+    """RaidAdapter over _ACCOUNTS with the given adapter factory."""
+    return RaidAdapter(_ACCOUNTS, headless=True, delays={}, adapter_factory=factory)
+
+
+class FakeYouTubeAdapter:
+    """Hand-built YouTubeBrowserAdapter double that only counts calls."""
+
+    __slots__ = (
+        "assign_playlist_calls",
+        "assign_playlist_result",
+        "close_calls",
+        "open_calls",
+        "upload_calls",
+        "upload_result",
+        "upload_side_effect",
+    )
+
+    def __init__(
+        self,
+        upload_result: UploadResult | None = None,
+        upload_side_effect: Exception | None = None,
+        assign_playlist_result: bool = True,
+    ) -> None:
+        self.open_calls = 0
+        self.close_calls = 0
+        self.upload_calls = 0
+        self.assign_playlist_calls = 0
+        self.upload_result = upload_result or UploadResult(
+            video_id="abc123",
+            url="https://youtu.be/abc123",
+            title="Test Video",
+            account_name="test",
+        )
+        self.upload_side_effect = upload_side_effect
+        self.assign_playlist_result = assign_playlist_result
+
+    def open(self) -> None:
+        self.open_calls += 1
+
+    def close(self) -> None:
+        self.close_calls += 1
+
+    def upload(self, path: Path, title: str, description: str = "") -> UploadResult:
+        self.upload_calls += 1
+        if self.upload_side_effect is not None:
+            raise self.upload_side_effect
+        return self.upload_result
+
+    def assign_playlist(self, video_id: str, playlist_name: str) -> bool:
+        self.assign_playlist_calls += 1
+        return self.assign_playlist_result
+
+
+class OrderRecordingAdapter(FakeYouTubeAdapter):
+    """FakeYouTubeAdapter that appends its account name to a shared log on upload."""
+
+    __slots__ = ("log", "name")
+
+    def __init__(self, name: str, log: list[str]) -> None:
+        super().__init__()
+        self.name = name
+        self.log = log
+
+    def upload(self, path: Path, title: str, description: str = "") -> UploadResult:
+        self.log.append(self.name)
+        return super().upload(path, title, description)
 
 
 class TestRaidAdapter:
@@ -27,80 +124,30 @@ class TestRaidAdapter:
         self.mock_playwright_inst = mock_playwright_inst
 
     @pytest.fixture
-    def accounts(self) -> list[YouTubeAccount]:
-        return [
-            YouTubeAccount(
-                name="primary",
-                storage_state=Path("/tmp/primary.json"),
-                cookies_path=Path("/tmp/primary.txt"),
-                role="primary",
-            ),
-            YouTubeAccount(
-                name="mirror-1",
-                storage_state=Path("/tmp/mirror1.json"),
-                cookies_path=Path("/tmp/mirror1.txt"),
-                role="mirror",
-            ),
-            YouTubeAccount(
-                name="mirror-2",
-                storage_state=Path("/tmp/mirror2.json"),
-                cookies_path=Path("/tmp/mirror2.txt"),
-                role="mirror",
-            ),
-        ]
+    def mock_adapter(self) -> FakeYouTubeAdapter:
+        return FakeYouTubeAdapter()
 
-    @pytest.fixture
-    def mock_adapter(self) -> Mock:
-        adapter = Mock()
-        adapter.open = Mock()
-        adapter.close = Mock()
-        adapter.upload = Mock(
-            return_value=UploadResult(
-                video_id="abc123",
-                url="https://youtu.be/abc123",
-                title="Test Video",
-                account_name="test",
-            )
-        )
-        adapter.assign_playlist = Mock()
-        return adapter
-
-    def test_open_launches_all_browsers(
-        self, accounts: list[YouTubeAccount], mock_adapter: Mock
-    ) -> None:
-        raid = RaidAdapter(
-            accounts, headless=True, delays={}, adapter_factory=lambda x, b: mock_adapter
-        )
+    def test_open_close_lifecycle(self, mock_adapter: FakeYouTubeAdapter) -> None:
+        raid = _make_raid(lambda x, b: mock_adapter)
         raid.open()
 
-        assert mock_adapter.open.call_count == 3
+        assert mock_adapter.open_calls == 3
         self.mock_playwright_inst.chromium.launch.assert_called_once_with(
             headless=True, executable_path="/usr/bin/chrome"
         )
 
-    def test_close_closes_all_browsers(
-        self, accounts: list[YouTubeAccount], mock_adapter: Mock
-    ) -> None:
-        raid = RaidAdapter(
-            accounts, headless=True, delays={}, adapter_factory=lambda x, b: mock_adapter
-        )
-        raid.open()
         browser = raid._browser
         playwright = raid._playwright
         raid.close()
 
-        assert mock_adapter.close.call_count == 3
+        assert mock_adapter.close_calls == 3
         assert browser is not None
         cast(Mock, browser).close.assert_called_once()
         assert playwright is not None
         cast(Mock, playwright).stop.assert_called_once()
 
-    def test_upload_returns_all_results(
-        self, accounts: list[YouTubeAccount], mock_adapter: Mock
-    ) -> None:
-        raid = RaidAdapter(
-            accounts, headless=True, delays={}, adapter_factory=lambda x, b: mock_adapter
-        )
+    def test_upload_returns_all_results(self, mock_adapter: FakeYouTubeAdapter) -> None:
+        raid = _make_raid(lambda x, b: mock_adapter)
         raid.open()
         results, _playlist_failures = raid.upload(
             Path("/tmp/test.mp4"), "Test Title", "test-playlist"
@@ -112,38 +159,21 @@ class TestRaidAdapter:
         assert "mirror-2" in results
         assert all(r is not None for r in results.values())
 
-    def test_upload_calls_assign_playlist(
-        self, accounts: list[YouTubeAccount], mock_adapter: Mock
-    ) -> None:
-        raid = RaidAdapter(
-            accounts, headless=True, delays={}, adapter_factory=lambda x, b: mock_adapter
-        )
+    def test_upload_calls_assign_playlist(self, mock_adapter: FakeYouTubeAdapter) -> None:
+        raid = _make_raid(lambda x, b: mock_adapter)
         raid.open()
         _results, _pf = raid.upload(Path("/tmp/test.mp4"), "Test Title", "test-playlist")
         raid.close()
 
-        assert mock_adapter.assign_playlist.call_count == 3
+        assert mock_adapter.assign_playlist_calls == 3
 
-    def test_mirror_failure_returns_none(self, accounts: list[YouTubeAccount]) -> None:
-        def factory(acct: YouTubeAccount, browser: Any) -> Mock:
-            adapter = Mock()
-            adapter.open = Mock()
-            adapter.close = Mock()
+    def test_mirror_failure_returns_none(self) -> None:
+        def factory(acct: YouTubeAccount, browser: Any) -> FakeYouTubeAdapter:
             if acct.role == "mirror":
-                adapter.upload = Mock(side_effect=Exception("Upload failed"))
-            else:
-                adapter.upload = Mock(
-                    return_value=UploadResult(
-                        video_id="abc123",
-                        url="https://youtu.be/abc123",
-                        title="Test Video",
-                        account_name=acct.name,
-                    )
-                )
-            adapter.assign_playlist = Mock()
-            return adapter
-
-        raid = RaidAdapter(accounts, headless=True, delays={}, adapter_factory=factory)
+                return FakeYouTubeAdapter(upload_side_effect=Exception("Upload failed"))
+            return FakeYouTubeAdapter()
+
+        raid = _make_raid(factory)
         raid.open()
         results, _pf = raid.upload(Path("/tmp/test.mp4"), "Test Title", "test-playlist")
         raid.close()
@@ -152,51 +182,24 @@ class TestRaidAdapter:
         assert results["mirror-1"] is None
         assert results["mirror-2"] is None
 
-    def test_uploads_to_primary_first(self, accounts: list[YouTubeAccount]) -> None:
-        call_order = []
-
-        def factory(acct: YouTubeAccount, browser: Any) -> Mock:
-            adapter = Mock()
-            adapter.open = Mock()
-            adapter.close = Mock()
-            adapter.assign_playlist = Mock()
+    def test_uploads_to_primary_first(self) -> None:
+        call_order: list[str] = []
 
-            def upload(*args, **kwargs) -> UploadResult:
-                call_order.append(acct.name)
-                return UploadResult(
-                    video_id="abc123",
-                    url="https://youtu.be/abc123",
-                    title="Test Video",
-                    account_name=acct.name,
-                )
+        def factory(acct: YouTubeAccount, browser: Any) -> OrderRecordingAdapter:
+            return OrderRecordingAdapter(acct.name, call_order)
 
-            adapter.upload = Mock(side_effect=upload)
-            return adapter
-
-        raid = RaidAdapter(accounts, headless=True, delays={}, adapter_factory=factory)
+        raid = _make_raid(factory)
         raid.open()
         _results, _pf = raid.upload(Path("/tmp/test.mp4"), "Test Title", "test-playlist")
         raid.close()
 
         assert call_order[0] == "primary"
 
-    def test_playlist_failure_counted(self, accounts: list[YouTubeAccount]) -> None:
-        def factory(acct: YouTubeAccount, browser: Any) -> Mock:
-            adapter = Mock()
-            adapter.open = Mock()
-            adapter.close = Mock()
-            adapter.upload = Mock(
-                return_value=UploadResult(
-                    video_id="abc123",
-                    url="https://youtu.be/abc123",
-                    title="Test Video",
-                    account_name=acct.name,
-                )
-            )
-            adapter.assign_playlist = Mock(return_value=False)
-            return adapter
-
-        raid = RaidAdapter(accounts, headless=True, delays={}, adapter_factory=factory)
+    def test_playlist_failure_counted(self) -> None:
+        def factory(acct: YouTubeAccount, browser: Any) -> FakeYouTubeAdapter:
+            return FakeYouTubeAdapter(assign_playlist_result=False)
+
+        raid = _make_raid(factory)
         raid.open()
         results, failures = raid.upload(Path("/tmp/test.mp4"), "Test Title", "test-playlist")
         raid.close()
@@ -204,23 +207,11 @@ class TestRaidAdapter:
         assert failures == 3
         assert all(r is not None for r in results.values())
 
-    def test_playlist_failure_primary_only(self, accounts: list[YouTubeAccount]) -> None:
-        def factory(acct: YouTubeAccount, browser: Any) -> Mock:
-            adapter = Mock()
-            adapter.open = Mock()
-            adapter.close = Mock()
-            adapter.upload = Mock(
-                return_value=UploadResult(
-                    video_id="abc123",
-                    url="https://youtu.be/abc123",
-                    title="Test Video",
-                    account_name=acct.name,
-                )
-            )
-            adapter.assign_playlist = Mock(return_value=(acct.role != "primary"))
-            return adapter
-
-        raid = RaidAdapter(accounts, headless=True, delays={}, adapter_factory=factory)
+    def test_playlist_failure_primary_only(self) -> None:
+        def factory(acct: YouTubeAccount, browser: Any) -> FakeYouTubeAdapter:
+            return FakeYouTubeAdapter(assign_playlist_result=acct.role != "primary")
+
+        raid = _make_raid(factory)
         raid.open()
         _results, failures = raid.upload(Path("/tmp/test.mp4"), "Test Title", "test-playlist")
         raid.close()
@@ -228,7 +219,7 @@ class TestRaidAdapter:
         assert failures == 1
 
     def test_empty_accounts_raises_error(self) -> None:
-        with pytest.raises(ValueError, match="No accounts configured"):
+        with pytest.raises(ValueError, match=_EMPTY_ACCOUNTS_RE):
             RaidAdapter([], headless=True, delays={})
 
     def test_no_primary_account_raises_error(self) -> None:
@@ -240,5 +231,19 @@ class TestRaidAdapter:
                 role="mirror",
             ),
         ]
-        with pytest.raises(ValueError, match="No primary account found"):
+        with pytest.raises(ValueError, match=_NO_PRIMARY_RE):
             RaidAdapter(accounts, headless=True, delays={})
+
+
+class TestFakeYouTubeAdapter:
+    """Keeps the hand-built double honest, as autospec would for a Mock."""
+
+    @pytest.mark.parametrize("method", ["open", "close", "upload", "assign_playlist"])
+    def test_signature_matches_video_uploader(self, method: str) -> None:
+        fake = inspect.signature(getattr(FakeYouTubeAdapter, method))
+        port = inspect.signature(getattr(VideoUploader, method))
+
+        assert list(fake.parameters) == list(port.parameters)
+
+    def test_satisfies_video_uploader(self) -> None:
+        assert isinstance(FakeYouTubeAdapter(), VideoUploader)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import tempfile
 from datetime import date
 from pathlib import Path
 
@@ -16,14 +15,8 @@ from yt_recorder.domain.models import RegistryEntry, TranscriptStatus
 
 
 @pytest.fixture
-def temp_registry_dir() -> Path:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
-@pytest.fixture
-def registry_store(temp_registry_dir: Path) -> MarkdownRegistryStore:
-    registry_path = temp_registry_dir / "registry.md"
+def registry_store(tmp_path: Path) -> MarkdownRegistryStore:
+    registry_path = tmp_path / "registry.md"
     return MarkdownRegistryStore(registry_path, ["primary", "mirror-1"])
 
 
@@ -56,7 +49,79 @@ class TestRegistryEntry:
             entry.file = "other.mp4"
 
 
-class TestMarkdownRegistryStore:
+class TestMarkdownRegistryStoreReadOnly:
+    """Queries against one registry written once for the whole class."""
+
+    @pytest.fixture(scope="class")
+    def store_with_entry(self, tmp_path_factory: pytest.TempPathFactory) -> MarkdownRegistryStore:
+        registry_path = tmp_path_factory.mktemp("reg") / "registry.md"
+        store = MarkdownRegistryStore(registry_path, ["primary", "mirror-1"])
+        store.append_many(
+            [
+                RegistryEntry(
+                    file="video.mp4",
+                    playlist="root",
+                    uploaded_date=date(2026, 1, 15),
+                    transcript_status=TranscriptStatus.PENDING,
+                    account_ids={"primary": "abc123", "mirror-1": "xyz789"},
+                ),
+                RegistryEntry(
+                    file="dashed.mp4",
+                    playlist="root",
+                    uploaded_date=date(2026, 1, 15),
+                    transcript_status=TranscriptStatus.PENDING,
+                    account_ids={"primary": "abc123", "mirror-1": "—"},
+                ),
+                RegistryEntry(
+                    file="folder-a/video.mp4",
+                    playlist="folder-a",
+                    uploaded_date=date(2026, 1, 15),
+                    transcript_status=TranscriptStatus.PENDING,
+                    account_ids={"primary": "aaa111"},
+                ),
+                RegistryEntry(
+                    file="folder-b/video.mp4",
+                    playlist="folder-b",
+                    uploaded_date=date(2026, 1, 15),
+                    transcript_status=TranscriptStatus.PENDING,
+                    account_ids={"primary": "bbb222"},
+                ),
+            ]
+        )
+        return store
+
+    def test_is_registered(self, store_with_entry: MarkdownRegistryStore) -> None:
+        assert store_with_entry.is_registered("video.mp4") is True
+        assert store_with_entry.is_registered("other.mp4") is False
+
+    @pytest.mark.parametrize(
+        ("file", "account", "expected"),
+        [
+            ("video.mp4", "primary", "abc123"),
+            ("video.mp4", "mirror-1", "xyz789"),
+            ("video.mp4", "nonexistent", None),
+            ("other.mp4", "primary", None),
+            ("dashed.mp4", "primary", "abc123"),
+            ("dashed.mp4", "mirror-1", None),
+        ],
+    )
+    def test_get_video_id(
+        self,
+        store_with_entry: MarkdownRegistryStore,
+        file: str,
+        account: str,
+        expected: str | None,
+    ) -> None:
+        assert store_with_entry.get_video_id(file, account) == expected
+
+    def test_relative_path_keying(self, store_with_entry: MarkdownRegistryStore) -> None:
+        assert store_with_entry.get_video_id("folder-a/video.mp4", "primary") == "aaa111"
+        assert store_with_entry.get_video_id("folder-b/video.mp4", "primary") == "bbb222"
+
+
+class TestMarkdownRegistryStoreMutating:
+    """Tests that write to the registry; each gets a fresh function-scoped store."""
+
     def test_create_registry(self, registry_store: MarkdownRegistryStore) -> None:
         registry_store._create_registry()
 
@@ -99,8 +164,7 @@ class TestMarkdownRegistryStore:
             account_ids={"primary": "def456"},
         )
 
-        registry_store.append(entry1)
-        registry_store.append(entry2)
+        registry_store.append_many([entry1, entry2])
 
         entries = registry_store.load()
 
@@ -110,11 +174,18 @@ class TestMarkdownRegistryStore:
         assert entries[1].file == "folder-b/video2.mp4"
         assert entries[1].has_transcript is False
 
+    def test_append_many_empty_is_noop(self, registry_store: MarkdownRegistryStore) -> None:
+        registry_store.append_many([])
+
+        assert not registry_store.registry_path.exists()
+
     def test_load_nonexistent_registry(self, registry_store: MarkdownRegistryStore) -> None:
         with pytest.raises(RegistryFileNotFoundError):
             registry_store.load()
 
-    def test_is_registered(self, registry_store: MarkdownRegistryStore) -> None:
+    def test_load_reparses_after_external_write(
+        self, registry_store: MarkdownRegistryStore
+    ) -> None:
         entry = RegistryEntry(
             file="video.mp4",
             playlist="root",
@@ -122,46 +193,37 @@ class TestMarkdownRegistryStore:
             transcript_status=TranscriptStatus.PENDING,
             account_ids={"primary": "abc123"},
         )
-
         registry_store.append(entry)
+        assert len(registry_store.load()) == 1
 
-        assert registry_store.is_registered("video.mp4") is True
-        assert registry_store.is_registered("other.mp4") is False
+        # Edit behind the store's back: a new inode and size invalidate the cache
+        path = registry_store.registry_path
+        content = path.read_text(encoding="utf-8")
+        path.unlink()
+        path.write_text(content + "| other.mp4 | root | 2026-01-16 | done | def456 |\n")
 
-    def test_is_registered_nonexistent_registry(
-        self, registry_store: MarkdownRegistryStore
-    ) -> None:
-        assert registry_store.is_registered("video.mp4") is False
+        entries = registry_store.load()
+        assert [e.file for e in entries] == ["video.mp4", "other.mp4"]
 
-    def test_get_video_id(self, registry_store: MarkdownRegistryStore) -> None:
+    def test_load_returns_independent_lists(self, registry_store: MarkdownRegistryStore) -> None:
         entry = RegistryEntry(
             file="video.mp4",
             playlist="root",
             uploaded_date=date(2026, 1, 15),
             transcript_status=TranscriptStatus.PENDING,
-            account_ids={"primary": "abc123", "mirror-1": "xyz789"},
+            account_ids={"primary": "abc123"},
         )
-
         registry_store.append(entry)
 
-        assert registry_store.get_video_id("video.mp4", "primary") == "abc123"
-        assert registry_store.get_video_id("video.mp4", "mirror-1") == "xyz789"
-        assert registry_store.get_video_id("video.mp4", "nonexistent") is None
-        assert registry_store.get_video_id("other.mp4", "primary") is None
-
-    def test_get_video_id_with_dash(self, registry_store: MarkdownRegistryStore) -> None:
-        entry = RegistryEntry(
-            file="video.mp4",
-            playlist="root",
-            uploaded_date=date(2026, 1, 15),
-            transcript_status=TranscriptStatus.PENDING,
-            account_ids={"primary": "abc123", "mirror-1": "—"},
-        )
+        first = registry_store.load()
+        first.clear()
 
-        registry_store.append(entry)
+        assert len(registry_store.load()) == 1
 
-        assert registry_store.get_video_id("video.mp4", "primary") == "abc123"
-        assert registry_store.get_video_id("video.mp4", "mirror-1") is None
+    def test_is_registered_nonexistent_registry(
+        self, registry_store: MarkdownRegistryStore
+    ) -> None:
+        assert registry_store.is_registered("video.mp4") is False
 
     def test_update_transcript(self, registry_store: MarkdownRegistryStore) -> None:
         entry = RegistryEntry(
@@ -192,8 +254,8 @@ class TestMarkdownRegistryStore:
         with pytest.raises(RegistryWriteError):
             registry_store.update_transcript("other.mp4", TranscriptStatus.DONE)
 
-    def test_round_trip_variable_columns(self, temp_registry_dir: Path) -> None:
-        registry_path = temp_registry_dir / "registry.md"
+    def test_round_trip_variable_columns(self, tmp_path: Path) -> None:
+        registry_path = tmp_path / "registry.md"
         store1 = MarkdownRegistryStore(registry_path, ["primary", "mirror-1"])
 
         entry = RegistryEntry(
@@ -214,30 +276,8 @@ class TestMarkdownRegistryStore:
         assert entries[0].account_ids["primary"] == "abc123"
         assert entries[0].account_ids["mirror-1"] == "xyz789"
 
-    def test_relative_path_keying(self, registry_store: MarkdownRegistryStore) -> None:
-        entry1 = RegistryEntry(
-            file="folder-a/video.mp4",
-            playlist="folder-a",
-            uploaded_date=date(2026, 1, 15),
-            transcript_status=TranscriptStatus.PENDING,
-            account_ids={"primary": "abc123"},
-        )
-        entry2 = RegistryEntry(
-            file="folder-b/video.mp4",
-            playlist="folder-b",
-            uploaded_date=date(2026, 1, 15),
-            transcript_status=TranscriptStatus.PENDING,
-            account_ids={"primary": "def456"},
-        )
-
-        registry_store.append(entry1)
-        registry_store.append(entry2)
-
-        assert registry_store.get_video_id("folder-a/video.mp4", "primary") == "abc123"
-        assert registry_store.get_video_id("folder-b/video.mp4", "primary") == "def456"
-
-    def test_atomic_write_crash_safety(self, temp_registry_dir: Path) -> None:
-        registry_path = temp_registry_dir / "registry.md"
+    def test_atomic_write_crash_safety(self, tmp_path: Path) -> None:
+        registry_path = tmp_path / "registry.md"
         store = MarkdownRegistryStore(registry_path, ["primary"])
 
         entry1 = RegistryEntry(
@@ -266,8 +306,8 @@ class TestMarkdownRegistryStore:
         assert "video2.mp4" in new_content
         assert len(new_content) > len(original_content)
 
-    def test_multiple_accounts_in_row(self, temp_registry_dir: Path) -> None:
-        registry_path = temp_registry_dir / "registry.md"
+    def test_multiple_accounts_in_row(self, tmp_path: Path) -> None:
+        registry_path = tmp_path / "registry.md"
         store = MarkdownRegistryStore(
             registry_path, ["primary", "mirror-1", "mirror-2", "mirror-3"]
         )
@@ -327,8 +367,8 @@ class TestMarkdownRegistryStore:
 
 
 class TestRegistryMigration:
-    def test_parse_v1_emoji_done(self, temp_registry_dir: Path) -> None:
-        registry_path = temp_registry_dir / "registry.md"
+    def test_parse_v1_emoji_done(self, tmp_path: Path) -> None:
+        registry_path = tmp_path / "registry.md"
         v1_content = (
             "# Recordings Registry\n\n"
             "| File | Playlist | Uploaded | Transcript | primary |\n"
@@ -343,8 +383,8 @@ class TestRegistryMigration:
         assert entries[0].transcript_status == TranscriptStatus.DONE
         assert entries[0].has_transcript is True
 
-    def test_parse_v1_emoji_pending(self, temp_registry_dir: Path) -> None:
-        registry_path = temp_registry_dir / "registry.md"
+    def test_parse_v1_emoji_pending(self, tmp_path: Path) -> None:
+        registry_path = tmp_path / "registry.md"
         v1_content = (
             "# Recordings Registry\n\n"
             "| File | Playlist | Uploaded | Transcript | primary |\n"
@@ -359,8 +399,8 @@ class TestRegistryMigration:
         assert entries[0].transcript_status == TranscriptStatus.PENDING
         assert entries[0].has_transcript is False
 
-    def test_parse_v2_string_formats(self, temp_registry_dir: Path) -> None:
-        registry_path = temp_registry_dir / "registry.md"
+    def test_parse_v2_string_formats(self, tmp_path: Path) -> None:
+        registry_path = tmp_path / "registry.md"
         v2_content = (
             "# Recordings Registry\n\n"
             "<!-- registry_version: 2 -->\n\n"
@@ -381,8 +421,8 @@ class TestRegistryMigration:
         assert entries[2].transcript_status == TranscriptStatus.UNAVAILABLE
         assert entries[3].transcript_status == TranscriptStatus.ERROR
 
-    def test_parse_unknown_raises(self, temp_registry_dir: Path) -> None:
-        registry_path = temp_registry_dir / "registry.md"
+    def test_parse_unknown_raises(self, tmp_path: Path) -> None:
+        registry_path = tmp_path / "registry.md"
         bad_content = (
             "# Recordings Registry\n\n"
             "| File | Playlist | Uploaded | Transcript | primary |\n"
@@ -395,8 +435,8 @@ class TestRegistryMigration:
         with pytest.raises(RegistryParseError, match="Unknown transcript status"):
             store.load()
 
-    def test_auto_upgrade_on_write(self, temp_registry_dir: Path) -> None:
-        registry_path = temp_registry_dir / "registry.md"
+    def test_auto_upgrade_on_write(self, tmp_path: Path) -> None:
+        registry_path = tmp_path / "registry.md"
         v1_content = (
             "# Recordings Registry\n\n"
             "| File | Playlist | Uploaded | Transcript | primary |\n"
@@ -414,19 +454,20 @@ class TestRegistryMigration:
         assert "✅" not in content
         assert "| done |" in content
 
-    def test_round_trip_v2(self, temp_registry_dir: Path) -> None:
-        registry_path = temp_registry_dir / "registry.md"
+    def test_round_trip_v2(self, tmp_path: Path) -> None:
+        registry_path = tmp_path / "registry.md"
         store = MarkdownRegistryStore(registry_path, ["primary"])
 
-        for status in TranscriptStatus:
-            entry = RegistryEntry(
+        store.append_many(
+            RegistryEntry(
                 file=f"{status.value}.mp4",
                 playlist="test",
                 uploaded_date=date(2025, 1, 20),
                 transcript_status=status,
                 account_ids={"primary": "id1"},
             )
-            store.append(entry)
+            for status in TranscriptStatus
+        )
 
         entries = store.load()
 
@@ -434,8 +475,8 @@ class TestRegistryMigration:
         for entry, expected in zip(entries, TranscriptStatus):
             assert entry.transcript_status == expected
 
-    def test_update_transcript_with_enum(self, temp_registry_dir: Path) -> None:
-        registry_path = temp_registry_dir / "registry.md"
+    def test_update_transcript_with_enum(self, tmp_path: Path) -> None:
+        registry_path = tmp_path / "registry.md"
         store = MarkdownRegistryStore(registry_path, ["primary"])
 
         entry = RegistryEntry(
@@ -1,75 +1,114 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import os
-import tempfile
-from collections.abc import Generator
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Callable
 
 import pytest
 
 from yt_recorder.adapters.scanner import ScanResult, scan_recordings
 
 
+def _build_recordings_tree(base: Path) -> Path:
+    """Populate base with the scanner test tree and return it."""
+    # Each .mp4 gets the next mtime as it is created: deterministic ordering
+    # for the sorting test without re-scanning the tree afterwards
+    mtimes = itertools.count(1000)
+
+    def touch_video(path: Path) -> None:
+        path.touch()
+        mtime = next(mtimes)
+        os.utime(path, (mtime, mtime))
+
+    # Create root-level files
+    touch_video(base / "video1.mp4")
+    (base / "video2.mkv").touch()
+
+    # Create subdirectories with files
+    talks_dir = base / "talks"
+    talks_dir.mkdir()
+    touch_video(talks_dir / "talk1.mp4")
+    touch_video(talks_dir / "talk2.mp4")
+
+    ideas_dir = base / "ideas"
+    ideas_dir.mkdir()
+    touch_video(ideas_dir / "idea1.mp4")
+
+    # Create nested directory (depth > 1)
+    nested = talks_dir / "nested"
+    nested.mkdir()
+    touch_video(nested / "deep.mp4")
+
+    # Create hidden files/dirs
+    touch_video(base / ".hidden.mp4")
+    hidden_dir = base / ".hidden_dir"
+    hidden_dir.mkdir()
+    touch_video(hidden_dir / "file.mp4")
+
+    # Create non-video files
+    (base / "readme.txt").touch()
+    (talks_dir / "notes.txt").touch()
+
+    return base
+
+
+@pytest.fixture(scope="module")
+def temp_recordings_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary recordings directory with test files.
+
+    Built once per module; tests must treat it as read-only.
+    """
+    return _build_recordings_tree(tmp_path_factory.mktemp("recordings"))
+
+
 @pytest.fixture
-def temp_recordings_dir() -> Generator[Path, None, None]:
-    """Create a temporary recordings directory with test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base = Path(tmpdir)
-
-        # Create root-level files
-        (base / "video1.mp4").touch()
-        (base / "video2.mkv").touch()
-
-        # Create subdirectories with files
-        talks_dir = base / "talks"
-        talks_dir.mkdir()
-        (talks_dir / "talk1.mp4").touch()
-        (talks_dir / "talk2.mp4").touch()
-
-        ideas_dir = base / "ideas"
-        ideas_dir.mkdir()
-        (ideas_dir / "idea1.mp4").touch()
-
-        # Create nested directory (depth > 1)
-        nested = talks_dir / "nested"
-        nested.mkdir()
-        (nested / "deep.mp4").touch()
-
-        # Create hidden files/dirs
-        (base / ".hidden.mp4").touch()
-        hidden_dir = base / ".hidden_dir"
-        hidden_dir.mkdir()
-        (hidden_dir / "file.mp4").touch()
-
-        # Create symlink (target is hidden to avoid being scanned)
-        symlink_target = base / ".symlink_target.mp4"
-        symlink_target.touch()
-        symlink = base / "symlink.mp4"
-        symlink.symlink_to(symlink_target)
-
-        # Create non-video files
-        (base / "readme.txt").touch()
-        (talks_dir / "notes.txt").touch()
-
-        # Set mtimes for sorting test
-        # Ensure deterministic ordering
-        for i, file in enumerate(sorted(base.glob("**/*.mp4"))):
-            os.utime(file, (1000 + i, 1000 + i))
-
-        yield base
+def temp_recordings_dir_with_symlink(tmp_path: Path) -> Path:
+    """Recordings tree plus a symlinked video, for the one test that needs it.
+
+    Kept out of the shared tree: symlink_to can need extra privileges on
+    Windows and is slow on network filesystems.
+    """
+    base = _build_recordings_tree(tmp_path)
+    # Target is hidden to avoid being scanned
+    symlink_target = base / ".symlink_target.mp4"
+    symlink_target.touch()
+    (base / "symlink.mp4").symlink_to(symlink_target)
+    return base
+
+
+ScanCache = Callable[[tuple[str, ...], tuple[str, ...], int], list[ScanResult]]
+
+
+@pytest.fixture(scope="module")
+def scan_cache(temp_recordings_dir: Path) -> ScanCache:
+    """scan_recordings over the shared tree, memoized on (extensions, exclude_dirs, max_depth).
+
+    Results are shared between tests; do not mutate them.
+    """
+
+    @functools.cache
+    def _scan(
+        extensions: tuple[str, ...], exclude_dirs: tuple[str, ...], max_depth: int
+    ) -> list[ScanResult]:
+        return scan_recordings(
+            directory=temp_recordings_dir,
+            extensions=list(extensions),
+            exclude_dirs=list(exclude_dirs),
+            max_depth=max_depth,
+        )
+
+    return _scan
 
 
 class TestScanRecordings:
     """Tests for scan_recordings function."""
 
-    def test_scan_root_files_only(self, temp_recordings_dir: Path) -> None:
+    def test_scan_root_files_only(self, temp_recordings_dir: Path, scan_cache: ScanCache) -> None:
         """Test scanning root files with max_depth=0."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".mp4", ".mkv"],
-            exclude_dirs=[],
-            max_depth=0,
-        )
+        results = scan_cache((".mp4", ".mkv"), (), 0)
 
         # Should find video1.mp4 and video2.mkv at root
         assert len(results) == 2
@@ -80,23 +119,20 @@ class TestScanRecordings:
         for result in results:
             assert result.playlist == temp_recordings_dir.name
 
-    def test_scan_with_subdirs_depth_1(self, temp_recordings_dir: Path) -> None:
+    def test_scan_with_subdirs_depth_1(
+        self, temp_recordings_dir: Path, scan_cache: ScanCache
+    ) -> None:
         """Test scanning with max_depth=1 includes subdirectory files."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".mp4", ".mkv"],
-            exclude_dirs=[],
-            max_depth=1,
-        )
+        results = scan_cache((".mp4", ".mkv"), (), 1)
 
         # Should find: video1.mp4, video2.mkv (root) + talk1.mp4, talk2.mp4, idea1.mp4 (depth 1)
         # Should NOT find: deep.mp4 (depth 2)
         assert len(results) == 5
 
         # Check playlist names
-        root_results = [
-            r for r in results if r.path.parent.resolve() == temp_recordings_dir.resolve()
-        ]
+        # Result paths are already resolved; resolve the root once, not per result
+        root_str = str(temp_recordings_dir.resolve())
+        root_results = [r for r in results if str(r.path.parent) == root_str]
         assert len(root_results) == 2
         for r in root_results:
             assert r.playlist == temp_recordings_dir.name
@@ -111,81 +147,50 @@ class TestScanRecordings:
         for r in ideas_results:
             assert r.playlist == "ideas"
 
-    def test_scan_excludes_hidden_files(self, temp_recordings_dir: Path) -> None:
-        """Test that hidden files are excluded."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".mp4"],
-            exclude_dirs=[],
-            max_depth=1,
-        )
+    @pytest.mark.parametrize(
+        ("name", "max_depth"),
+        [
+            (".hidden.mp4", 1),
+            ("deep.mp4", 1),
+        ],
+        ids=["hidden_file", "beyond_max_depth"],
+    )
+    def test_scan_excludes(self, scan_cache: ScanCache, name: str, max_depth: int) -> None:
+        """Test that hidden files and too-deep files are excluded."""
+        results = scan_cache((".mp4",), (), max_depth)
 
-        # Should not find .hidden.mp4
         paths = {r.path.name for r in results}
-        assert ".hidden.mp4" not in paths
+        assert name not in paths
 
-    def test_scan_excludes_hidden_dirs(self, temp_recordings_dir: Path) -> None:
+    def test_scan_excludes_hidden_dirs(self, scan_cache: ScanCache) -> None:
         """Test that hidden directories are excluded."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".mp4"],
-            exclude_dirs=[],
-            max_depth=1,
-        )
+        results = scan_cache((".mp4",), (), 1)
 
         # Should not find files in .hidden_dir
         paths = {r.path.name for r in results}
         assert "file.mp4" not in paths or all(r.path.parent.name != ".hidden_dir" for r in results)
 
-    def test_scan_excludes_symlinks(self, temp_recordings_dir: Path) -> None:
-        """Test that symlinks are excluded."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".mp4"],
-            exclude_dirs=[],
-            max_depth=0,
-        )
-
-        # Should not find symlink.mp4
-        paths = {r.path.name for r in results}
-        assert "symlink.mp4" not in paths
-
-    def test_scan_respects_extension_filter(self, temp_recordings_dir: Path) -> None:
+    def test_scan_respects_extension_filter(self, scan_cache: ScanCache) -> None:
         """Test that only specified extensions are included."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".mp4"],
-            exclude_dirs=[],
-            max_depth=0,
-        )
+        results = scan_cache((".mp4",), (), 0)
 
         # Should find only .mp4 files, not .mkv
         paths = {r.path.name for r in results}
         assert "video1.mp4" in paths
         assert "video2.mkv" not in paths
 
-    def test_scan_excludes_non_video_files(self, temp_recordings_dir: Path) -> None:
+    def test_scan_excludes_non_video_files(self, scan_cache: ScanCache) -> None:
         """Test that non-video files are excluded."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".mp4", ".mkv"],
-            exclude_dirs=[],
-            max_depth=1,
-        )
+        results = scan_cache((".mp4", ".mkv"), (), 1)
 
         # Should not find .txt files
         paths = {r.path.name for r in results}
         assert "readme.txt" not in paths
         assert "notes.txt" not in paths
 
-    def test_scan_respects_exclude_dirs(self, temp_recordings_dir: Path) -> None:
+    def test_scan_respects_exclude_dirs(self, scan_cache: ScanCache) -> None:
         """Test that excluded directories are skipped."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".mp4"],
-            exclude_dirs=["talks"],
-            max_depth=1,
-        )
+        results = scan_cache((".mp4",), ("talks",), 1)
 
         # Should find video1.mp4 (root) and idea1.mp4, but not talk1.mp4 or talk2.mp4
         assert len(results) == 2
@@ -195,76 +200,30 @@ class TestScanRecordings:
         assert "talk1.mp4" not in paths
         assert "talk2.mp4" not in paths
 
-    def test_scan_respects_max_depth(self, temp_recordings_dir: Path) -> None:
-        """Test that max_depth is respected."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".mp4"],
-            exclude_dirs=[],
-            max_depth=1,
-        )
-
-        # Should not find deep.mp4 (at depth 2)
-        paths = {r.path.name for r in results}
-        assert "deep.mp4" not in paths
-
-    def test_scan_sorted_by_mtime(self, temp_recordings_dir: Path) -> None:
+    def test_scan_sorted_by_mtime(self, scan_cache: ScanCache) -> None:
         """Test that results are sorted by mtime ascending."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".mp4", ".mkv"],
-            exclude_dirs=[],
-            max_depth=1,
-        )
+        results = scan_cache((".mp4", ".mkv"), (), 1)
 
         # Verify sorted by mtime
         mtimes = [os.stat(r.path).st_mtime for r in results]
         assert mtimes == sorted(mtimes)
 
-    def test_scan_returns_absolute_paths(self, temp_recordings_dir: Path) -> None:
+    def test_scan_returns_absolute_paths(self, scan_cache: ScanCache) -> None:
         """Test that returned paths are absolute."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".mp4"],
-            exclude_dirs=[],
-            max_depth=0,
-        )
+        results = scan_cache((".mp4",), (), 0)
 
         for result in results:
             assert result.path.is_absolute()
 
-    def test_scan_empty_directory(self) -> None:
-        """Test scanning an empty directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base = Path(tmpdir)
-            results = scan_recordings(
-                directory=base,
-                extensions=[".mp4"],
-                exclude_dirs=[],
-                max_depth=1,
-            )
-
-            assert results == []
-
-    def test_scan_directory_with_no_matching_files(self, temp_recordings_dir: Path) -> None:
+    def test_scan_directory_with_no_matching_files(self, scan_cache: ScanCache) -> None:
         """Test scanning with no matching extensions."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".avi"],
-            exclude_dirs=[],
-            max_depth=1,
-        )
+        results = scan_cache((".avi",), (), 1)
 
         assert results == []
 
-    def test_scan_result_is_named_tuple(self, temp_recordings_dir: Path) -> None:
+    def test_scan_result_is_named_tuple(self, scan_cache: ScanCache) -> None:
         """Test that ScanResult is a NamedTuple with correct fields."""
-        results = scan_recordings(
-            directory=temp_recordings_dir,
-            extensions=[".mp4"],
-            exclude_dirs=[],
-            max_depth=0,
-        )
+        results = scan_cache((".mp4",), (), 0)
 
         assert len(results) > 0
         result = results[0]
@@ -276,13 +235,54 @@ class TestScanRecordings:
         assert isinstance(result.path, Path)
         assert isinstance(result.playlist, str)
 
-    def test_scan_case_insensitive_extensions(self, temp_recordings_dir: Path) -> None:
+    def test_scan_multiple_exclude_dirs(self, scan_cache: ScanCache) -> None:
+        """Test excluding multiple directories."""
+        results = scan_cache((".mp4",), ("talks", "ideas"), 1)
+
+        # Should find only root video1.mp4
+        assert len(results) == 1
+        assert results[0].path.name == "video1.mp4"
+
+
+class TestScanRecordingsIsolated:
+    """scan_recordings tests that build their own tree instead of the shared one.
+
+    A separate class so that, under xdist's loadscope distribution, these run
+    on another worker alongside the read-only TestScanRecordings tests.
+    """
+
+    def test_scan_excludes_symlinks(self, temp_recordings_dir_with_symlink: Path) -> None:
+        """Test that symlinks are excluded."""
+        results = scan_recordings(
+            directory=temp_recordings_dir_with_symlink,
+            extensions=[".mp4"],
+            exclude_dirs=[],
+            max_depth=0,
+        )
+
+        # Should not find symlink.mp4
+        paths = {r.path.name for r in results}
+        assert "symlink.mp4" not in paths
+
+    def test_scan_empty_directory(self, tmp_path: Path) -> None:
+        """Test scanning an empty directory."""
+        results = scan_recordings(
+            directory=tmp_path,
+            extensions=[".mp4"],
+            exclude_dirs=[],
+            max_depth=1,
+        )
+
+        assert results == []
+
+    def test_scan_case_insensitive_extensions(self, tmp_path: Path) -> None:
         """Test that extension matching is case-insensitive."""
-        # Create uppercase extension file
-        (temp_recordings_dir / "VIDEO.MP4").touch()
+        # Own tree: this test adds a file, the shared one stays read-only
+        recordings_dir = _build_recordings_tree(tmp_path)
+        (recordings_dir / "VIDEO.MP4").touch()
 
         results = scan_recordings(
-            directory=temp_recordings_dir,
+            directory=recordings_dir,
             extensions=[".mp4"],
             exclude_dirs=[],
             max_depth=0,
@@ -293,40 +293,33 @@ class TestScanRecordings:
         assert "video1.mp4" in paths
         assert "VIDEO.MP4" in paths
 
-    def test_scan_multiple_exclude_dirs(self, temp_recordings_dir: Path) -> None:
-        """Test excluding multiple directories."""
+    def test_scan_permission_error_handling(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test graceful handling of permission errors."""
+        (tmp_path / "video.mp4").touch()
+        restricted_dir = tmp_path / "restricted"
+        restricted_dir.mkdir()
+        (restricted_dir / "file.mp4").touch()
+
+        # Fail the listing instead of chmod 0o000, which root and Windows ignore.
+        # scan_recordings lists via Path.iterdir (os.listdir before 3.13,
+        # os.scandir after), so patch that rather than either os function.
+        real_iterdir = Path.iterdir
+
+        def iterdir(self: Path) -> Iterator[Path]:
+            if self.name == "restricted":
+                raise PermissionError(13, "Permission denied", str(self))
+            return real_iterdir(self)
+
+        monkeypatch.setattr(Path, "iterdir", iterdir)
+
         results = scan_recordings(
-            directory=temp_recordings_dir,
+            directory=tmp_path,
             extensions=[".mp4"],
-            exclude_dirs=["talks", "ideas"],
+            exclude_dirs=[],
             max_depth=1,
         )
 
-        # Should find only root video1.mp4
-        assert len(results) == 1
-        assert results[0].path.name == "video1.mp4"
-
-    def test_scan_permission_error_handling(self) -> None:
-        """Test graceful handling of permission errors."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base = Path(tmpdir)
-            restricted_dir = base / "restricted"
-            restricted_dir.mkdir()
-            (restricted_dir / "file.mp4").touch()
-
-            # Remove read permissions
-            restricted_dir.chmod(0o000)
-
-            try:
-                results = scan_recordings(
-                    directory=base,
-                    extensions=[".mp4"],
-                    exclude_dirs=[],
-                    max_depth=1,
-                )
-
-                # Should handle gracefully and return empty or partial results
-                assert isinstance(results, list)
-            finally:
-                # Restore permissions for cleanup
-                restricted_dir.chmod(0o755)
+        # Unreadable directory is skipped, the rest of the scan still succeeds
+        assert [r.path.name for r in results] == ["video.mp4"]
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 import json
-import tempfile
-from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
 
 from yt_recorder.adapters.transcriber import YtdlpTranscriptAdapter
 from yt_recorder.domain.exceptions import (
@@ -15,23 +14,22 @@ from yt_recorder.domain.exceptions import (
     TranscriptUnavailableError,
 )
 
+try:
+    import orjson  # type: ignore[import-not-found]
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    def _dumps(obj: object) -> bytes:
+        encoded: bytes = orjson.dumps(obj)
+        return encoded
 
+except ImportError:
 
-@pytest.fixture
-def cookies_file(temp_dir: Path) -> Path:
-    cookies_path = temp_dir / "cookies.txt"
-    cookies_path.write_text("# Netscape HTTP Cookie File\n")
-    return cookies_path
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode()
 
 
-@pytest.fixture
-def storage_state_file(temp_dir: Path) -> Path:
-    storage_state = {
+# Encoded once at import; fixtures and tests write the bytes directly
+_STORAGE_STATE_BYTES = _dumps(
+    {
         "cookies": [
             {
                 "domain": ".youtube.com",
@@ -51,23 +49,101 @@ def storage_state_file(temp_dir: Path) -> Path:
             },
         ]
     }
+)
+
+_SECURE_STORAGE_BYTES = _dumps(
+    {
+        "cookies": [
+            {
+                "domain": ".example.com",
+                "path": "/",
+                "name": "secure_cookie",
+                "value": "secure_value",
+                "secure": True,
+                "expires": 1735689600,
+            },
+            {
+                "domain": ".example.com",
+                "path": "/",
+                "name": "insecure_cookie",
+                "value": "insecure_value",
+                "secure": False,
+                "expires": 1735689600,
+            },
+        ]
+    }
+)
+
+_DOMAIN_FLAG_BYTES = _dumps(
+    {
+        "cookies": [
+            {
+                "domain": ".youtube.com",
+                "path": "/",
+                "name": "cookie1",
+                "value": "value1",
+                "secure": True,
+                "expires": 1735689600,
+            },
+            {
+                "domain": "example.com",
+                "path": "/",
+                "name": "cookie2",
+                "value": "value2",
+                "secure": False,
+                "expires": 1735689600,
+            },
+        ]
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def temp_dir(fs_module: FakeFilesystem) -> Path:
+    """Shared read-only inputs, in a pyfakefs filesystem kept for the module."""
+    return Path(fs_module.create_dir("/trx").path)
+
+
+@pytest.fixture(scope="module")
+def cookies_file(temp_dir: Path) -> Path:
+    cookies_path = temp_dir / "cookies.txt"
+    cookies_path.write_text("# Netscape HTTP Cookie File\n")
+    return cookies_path
+
+
+@pytest.fixture(scope="module")
+def storage_state_file(temp_dir: Path) -> Path:
     storage_state_path = temp_dir / "storage_state.json"
-    with open(storage_state_path, "w", encoding="utf-8") as f:
-        json.dump(storage_state, f)
+    storage_state_path.write_bytes(_STORAGE_STATE_BYTES)
     return storage_state_path
 
 
+@pytest.fixture
+def output_dir(fake_dir: Path) -> Path:
+    """Per-test output dir: fetch() and extract_cookies() write into it."""
+    return fake_dir / "transcripts"
+
+
+@pytest.fixture(scope="class")
+def adapter(cookies_file: Path) -> YtdlpTranscriptAdapter:
+    """Shared adapter for extract_cookies tests.
+
+    Each call overwrites the same cookies.txt, which the test reads straight
+    back. fetch() tests build their own adapter, since a leftover SRT would
+    leak between them.
+    """
+    return YtdlpTranscriptAdapter(cookies_file, Path("/out"))
+
+
 class TestYtdlpTranscriptAdapter:
-    def test_init_creates_output_dir(self, temp_dir: Path, cookies_file: Path) -> None:
-        output_dir = temp_dir / "transcripts"
+    def test_init_creates_output_dir(self, cookies_file: Path, output_dir: Path) -> None:
         adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
 
         assert output_dir.exists()
         assert adapter.cookies_path == cookies_file
         assert adapter.output_dir == output_dir
 
-    def test_init_with_existing_output_dir(self, temp_dir: Path, cookies_file: Path) -> None:
-        output_dir = temp_dir / "transcripts"
+    def test_init_with_existing_output_dir(self, cookies_file: Path, output_dir: Path) -> None:
         output_dir.mkdir()
         adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
 
@@ -76,9 +152,8 @@ class TestYtdlpTranscriptAdapter:
 
     @patch("yt_recorder.adapters.transcriber.YoutubeDL")
     def test_fetch_success(
-        self, mock_ydl_class: MagicMock, temp_dir: Path, cookies_file: Path
+        self, mock_ydl_class: MagicMock, cookies_file: Path, output_dir: Path
     ) -> None:
-        output_dir = temp_dir / "transcripts"
         adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
 
         mock_ydl = MagicMock()
@@ -95,9 +170,8 @@ class TestYtdlpTranscriptAdapter:
 
     @patch("yt_recorder.adapters.transcriber.YoutubeDL")
     def test_fetch_with_custom_language(
-        self, mock_ydl_class: MagicMock, temp_dir: Path, cookies_file: Path
+        self, mock_ydl_class: MagicMock, cookies_file: Path, output_dir: Path
     ) -> None:
-        output_dir = temp_dir / "transcripts"
         adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
 
         mock_ydl = MagicMock()
@@ -114,9 +188,8 @@ class TestYtdlpTranscriptAdapter:
 
     @patch("yt_recorder.adapters.transcriber.YoutubeDL")
     def test_fetch_no_captions_available(
-        self, mock_ydl_class: MagicMock, temp_dir: Path, cookies_file: Path
+        self, mock_ydl_class: MagicMock, cookies_file: Path, output_dir: Path
     ) -> None:
-        output_dir = temp_dir / "transcripts"
         adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
 
         mock_ydl = MagicMock()
@@ -128,9 +201,8 @@ class TestYtdlpTranscriptAdapter:
 
     @patch("yt_recorder.adapters.transcriber.YoutubeDL")
     def test_fetch_captions_not_ready(
-        self, mock_ydl_class: MagicMock, temp_dir: Path, cookies_file: Path
+        self, mock_ydl_class: MagicMock, cookies_file: Path, output_dir: Path
     ) -> None:
-        output_dir = temp_dir / "transcripts"
         adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
 
         mock_ydl = MagicMock()
@@ -142,9 +214,8 @@ class TestYtdlpTranscriptAdapter:
 
     @patch("yt_recorder.adapters.transcriber.YoutubeDL")
     def test_fetch_session_expired(
-        self, mock_ydl_class: MagicMock, temp_dir: Path, cookies_file: Path
+        self, mock_ydl_class: MagicMock, cookies_file: Path, output_dir: Path
     ) -> None:
-        output_dir = temp_dir / "transcripts"
         adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
 
         mock_ydl = MagicMock()
@@ -156,9 +227,8 @@ class TestYtdlpTranscriptAdapter:
 
     @patch("yt_recorder.adapters.transcriber.YoutubeDL")
     def test_fetch_srt_file_not_created(
-        self, mock_ydl_class: MagicMock, temp_dir: Path, cookies_file: Path
+        self, mock_ydl_class: MagicMock, cookies_file: Path, output_dir: Path
     ) -> None:
-        output_dir = temp_dir / "transcripts"
         adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
 
         mock_ydl = MagicMock()
@@ -168,11 +238,8 @@ class TestYtdlpTranscriptAdapter:
             adapter.fetch("dQw4w9WgXcQ")
 
     def test_extract_cookies_success(
-        self, temp_dir: Path, cookies_file: Path, storage_state_file: Path
+        self, adapter: YtdlpTranscriptAdapter, storage_state_file: Path
     ) -> None:
-        output_dir = temp_dir / "transcripts"
-        adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
-
         result = adapter.extract_cookies(storage_state_file)
 
         assert result.exists()
@@ -185,11 +252,8 @@ class TestYtdlpTranscriptAdapter:
         assert "test_value_123" in content
 
     def test_extract_cookies_netscape_format(
-        self, temp_dir: Path, cookies_file: Path, storage_state_file: Path
+        self, adapter: YtdlpTranscriptAdapter, storage_state_file: Path
     ) -> None:
-        output_dir = temp_dir / "transcripts"
-        adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
-
         result = adapter.extract_cookies(storage_state_file)
         content = result.read_text(encoding="utf-8")
         lines = content.strip().split("\n")
@@ -211,74 +275,31 @@ class TestYtdlpTranscriptAdapter:
             assert expires.isdigit()
             assert name in ["SSID", "NID"]
 
-    def test_extract_cookies_missing_file(self, temp_dir: Path, cookies_file: Path) -> None:
-        output_dir = temp_dir / "transcripts"
-        adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
-
-        missing_file = temp_dir / "nonexistent.json"
-
-        with pytest.raises(SessionExpiredError):
-            adapter.extract_cookies(missing_file)
-
-    def test_extract_cookies_invalid_json(self, temp_dir: Path, cookies_file: Path) -> None:
-        output_dir = temp_dir / "transcripts"
-        adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
-
-        invalid_file = temp_dir / "invalid.json"
-        invalid_file.write_text("{ invalid json }")
-
-        with pytest.raises(SessionExpiredError):
-            adapter.extract_cookies(invalid_file)
-
-    def test_extract_cookies_no_cookies_in_storage_state(
-        self, temp_dir: Path, cookies_file: Path
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            None,
+            b"{ invalid json }",
+            _dumps({"cookies": []}),
+            _dumps({"other_key": []}),
+        ],
+        ids=["missing_file", "invalid_json", "no_cookies", "missing_cookies_key"],
+    )
+    def test_extract_cookies_bad_storage_state(
+        self, adapter: YtdlpTranscriptAdapter, fake_dir: Path, payload: bytes | None
     ) -> None:
-        output_dir = temp_dir / "transcripts"
-        adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
-
-        storage_state_file = temp_dir / "empty_storage_state.json"
-        storage_state_file.write_text(json.dumps({"cookies": []}))
+        storage_state_file = fake_dir / "storage_state.json"
+        if payload is not None:
+            storage_state_file.write_bytes(payload)
 
         with pytest.raises(SessionExpiredError):
             adapter.extract_cookies(storage_state_file)
 
-    def test_extract_cookies_missing_cookies_key(self, temp_dir: Path, cookies_file: Path) -> None:
-        output_dir = temp_dir / "transcripts"
-        adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
-
-        storage_state_file = temp_dir / "no_cookies_key.json"
-        storage_state_file.write_text(json.dumps({"other_key": []}))
-
-        with pytest.raises(SessionExpiredError):
-            adapter.extract_cookies(storage_state_file)
-
-    def test_extract_cookies_secure_flag_handling(self, temp_dir: Path, cookies_file: Path) -> None:
-        output_dir = temp_dir / "transcripts"
-        adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
-
-        storage_state = {
-            "cookies": [
-                {
-                    "domain": ".example.com",
-                    "path": "/",
-                    "name": "secure_cookie",
-                    "value": "secure_value",
-                    "secure": True,
-                    "expires": 1735689600,
-                },
-                {
-                    "domain": ".example.com",
-                    "path": "/",
-                    "name": "insecure_cookie",
-                    "value": "insecure_value",
-                    "secure": False,
-                    "expires": 1735689600,
-                },
-            ]
-        }
-        storage_state_file = temp_dir / "secure_storage_state.json"
-        with open(storage_state_file, "w", encoding="utf-8") as f:
-            json.dump(storage_state, f)
+    def test_extract_cookies_secure_flag_handling(
+        self, adapter: YtdlpTranscriptAdapter, fake_dir: Path
+    ) -> None:
+        storage_state_file = fake_dir / "secure_storage_state.json"
+        storage_state_file.write_bytes(_SECURE_STORAGE_BYTES)
 
         result = adapter.extract_cookies(storage_state_file)
         content = result.read_text(encoding="utf-8")
@@ -286,33 +307,11 @@ class TestYtdlpTranscriptAdapter:
         assert "secure_cookie\tTRUE" in content or "secure_cookie" in content
         assert "insecure_cookie" in content
 
-    def test_extract_cookies_domain_flag_logic(self, temp_dir: Path, cookies_file: Path) -> None:
-        output_dir = temp_dir / "transcripts"
-        adapter = YtdlpTranscriptAdapter(cookies_file, output_dir)
-
-        storage_state = {
-            "cookies": [
-                {
-                    "domain": ".youtube.com",
-                    "path": "/",
-                    "name": "cookie1",
-                    "value": "value1",
-                    "secure": True,
-                    "expires": 1735689600,
-                },
-                {
-                    "domain": "example.com",
-                    "path": "/",
-                    "name": "cookie2",
-                    "value": "value2",
-                    "secure": False,
-                    "expires": 1735689600,
-                },
-            ]
-        }
-        storage_state_file = temp_dir / "domain_flag_storage_state.json"
-        with open(storage_state_file, "w", encoding="utf-8") as f:
-            json.dump(storage_state, f)
+    def test_extract_cookies_domain_flag_logic(
+        self, adapter: YtdlpTranscriptAdapter, fake_dir: Path
+    ) -> None:
+        storage_state_file = fake_dir / "domain_flag_storage_state.json"
+        storage_state_file.write_bytes(_DOMAIN_FLAG_BYTES)
 
         result = adapter.extract_cookies(storage_state_file)
         content = result.read_text(encoding="utf-8")
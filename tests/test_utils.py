@@ -1,52 +1,124 @@
 """Tests for utility functions."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
 
-from yt_recorder.utils import safe_resolve
+from yt_recorder.utils import find_chrome, safe_resolve, safe_resolve_many
 
 
 class TestSafeResolve:
     """Test safe_resolve path traversal protection."""
 
-    def test_normal_relative_path(self) -> None:
+    def test_normal_relative_path(self, fake_dir: Path) -> None:
         """Normal relative path within base directory succeeds."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base = Path(tmpdir).resolve()
-            (base / "subdir").mkdir()
-            (base / "subdir" / "file.mp4").touch()
+        base = fake_dir.resolve()
+        (base / "subdir").mkdir()
+        (base / "subdir" / "file.mp4").touch()
 
-            result = safe_resolve(base, "subdir/file.mp4")
-            assert result == base / "subdir" / "file.mp4"
-            assert result.is_relative_to(base)
+        result = safe_resolve(base, "subdir/file.mp4")
+        assert result == base / "subdir" / "file.mp4"
+        assert result.is_relative_to(base)
 
-    def test_dotdot_traversal_rejected(self) -> None:
+    def test_dotdot_traversal_rejected(self, fake_dir: Path) -> None:
         """Dotdot traversal (../../etc/passwd) raises ValueError."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base = Path(tmpdir)
-            with pytest.raises(ValueError, match="Path traversal rejected"):
-                safe_resolve(base, "../../etc/passwd")
+        with pytest.raises(ValueError, match="Path traversal rejected"):
+            safe_resolve(fake_dir, "../../etc/passwd")
 
-    def test_absolute_path_rejected(self) -> None:
+    def test_absolute_path_rejected(self, fake_dir: Path) -> None:
         """Absolute path in untrusted input raises ValueError."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base = Path(tmpdir)
-            with pytest.raises(ValueError, match="absolute path not allowed"):
-                safe_resolve(base, "/etc/passwd")
+        with pytest.raises(ValueError, match="absolute path not allowed"):
+            safe_resolve(fake_dir, "/etc/passwd")
 
-    def test_symlink_escape_rejected(self) -> None:
+    def test_symlink_escape_rejected(
+        self, tmp_path: Path, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
         """Symlink pointing outside base directory raises ValueError."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base = Path(tmpdir)
-            outside = Path(tmpdir).parent / "outside_file"
-            outside.touch()
+        outside = tmp_path_factory.mktemp("outside") / "file"
+        outside.touch()
 
-            symlink = base / "link_to_outside"
-            symlink.symlink_to(outside)
+        symlink = tmp_path / "link_to_outside"
+        symlink.symlink_to(outside)
 
-            with pytest.raises(ValueError, match="Path traversal rejected"):
-                safe_resolve(base, "link_to_outside")
+        with pytest.raises(ValueError, match="Path traversal rejected"):
+            safe_resolve(tmp_path, "link_to_outside")
 
-            outside.unlink()
+    def test_sibling_prefix_rejected(self, fake_dir: Path) -> None:
+        """Sibling dir sharing the base name as a prefix is not inside base."""
+        base = fake_dir / "base"
+        base.mkdir()
+        (fake_dir / "base-evil").mkdir()
+
+        with pytest.raises(ValueError, match="Path traversal rejected"):
+            safe_resolve(base, "../base-evil/file.mp4")
+
+
+class TestSafeResolveMany:
+    """Test batched safe_resolve_many."""
+
+    def test_resolves_in_order(self, fake_dir: Path) -> None:
+        """All paths resolve within base, preserving input order."""
+        base = fake_dir.resolve()
+
+        result = safe_resolve_many(base, ["b.mp4", "sub/a.mp4"])
+
+        assert result == [base / "b.mp4", base / "sub" / "a.mp4"]
+
+    def test_any_escape_rejected(self, fake_dir: Path) -> None:
+        """One traversing path rejects the whole batch."""
+        with pytest.raises(ValueError, match="Path traversal rejected"):
+            safe_resolve_many(fake_dir, ["ok.mp4", "../escape.mp4"])
+
+
+class TestFindChrome:
+    """Test find_chrome executable discovery."""
+
+    def test_windows_uses_program_files_env(
+        self, monkeypatch: pytest.MonkeyPatch, fake_dir: Path
+    ) -> None:
+        """Windows lookup honours %ProgramFiles% on a non-default drive."""
+        exe = fake_dir / "Google" / "Chrome" / "Application" / "chrome.exe"
+        exe.parent.mkdir(parents=True)
+        exe.touch(mode=0o755)
+        monkeypatch.setattr("platform.system", lambda: "Windows")
+        monkeypatch.setenv("ProgramFiles", str(fake_dir))
+        monkeypatch.delenv("ProgramFiles(x86)", raising=False)
+        monkeypatch.delenv("LOCALAPPDATA", raising=False)
+
+        assert find_chrome() == str(exe)
+
+    def test_windows_falls_back_to_localappdata(
+        self, monkeypatch: pytest.MonkeyPatch, fake_dir: Path
+    ) -> None:
+        """Per-user install under %LOCALAPPDATA% is found."""
+        exe = fake_dir / "Google" / "Chrome" / "Application" / "chrome.exe"
+        exe.parent.mkdir(parents=True)
+        exe.touch(mode=0o755)
+        monkeypatch.setattr("platform.system", lambda: "Windows")
+        monkeypatch.setenv("ProgramFiles", str(fake_dir / "missing"))
+        monkeypatch.delenv("ProgramFiles(x86)", raising=False)
+        monkeypatch.setenv("LOCALAPPDATA", str(fake_dir))
+
+        assert find_chrome() == str(exe)
+
+    def test_skips_non_executable(self, monkeypatch: pytest.MonkeyPatch, fake_dir: Path) -> None:
+        """Candidate without the execute bit is not returned."""
+        exe = fake_dir / "Google" / "Chrome" / "Application" / "chrome.exe"
+        exe.parent.mkdir(parents=True)
+        exe.touch(mode=0o644)
+        monkeypatch.setattr("platform.system", lambda: "Windows")
+        monkeypatch.setenv("ProgramFiles", str(fake_dir))
+        monkeypatch.delenv("ProgramFiles(x86)", raising=False)
+        monkeypatch.delenv("LOCALAPPDATA", raising=False)
+
+        with pytest.raises(FileNotFoundError):
+            find_chrome()
+
+    def test_not_found_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Missing Chrome raises FileNotFoundError with install hints."""
+        monkeypatch.setattr("platform.system", lambda: "Windows")
+        for env_var in ("ProgramFiles", "ProgramFiles(x86)", "LOCALAPPDATA"):
+            monkeypatch.delenv(env_var, raising=False)
+
+        with pytest.raises(FileNotFoundError, match="Install Google Chrome"):
+            find_chrome()
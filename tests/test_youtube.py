@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import cast
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from yt_recorder import constants
+from yt_recorder.adapters import youtube as youtube_module
 from yt_recorder.adapters.youtube import YouTubeBrowserAdapter
 from yt_recorder.domain.exceptions import (
     BotDetectionError,
@@ -21,25 +23,64 @@ from yt_recorder.domain.exceptions import (
 from yt_recorder.domain.models import UploadResult, YouTubeAccount
 
 
-@pytest.fixture
-def youtube_account() -> YouTubeAccount:
+class _El:
+    """Element handle stub for selectors whose calls a test never asserts on."""
+
+    __slots__ = ("_href",)
+
+    def __init__(self, href: str | None = None) -> None:
+        self._href = href
+
+    def click(self, **kwargs: object) -> None:
+        pass
+
+    def fill(self, value: str) -> None:
+        pass
+
+    def set_input_files(self, files: str) -> None:
+        pass
+
+    def get_attribute(self, name: str) -> str | None:
+        return self._href
+
+
+@pytest.fixture(autouse=True)
+def fake_sleep(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Stub out delays and the storage_state chmod for every test."""
+    sleep = Mock()
+    monkeypatch.setattr(youtube_module.time, "sleep", sleep)
+    monkeypatch.setattr(youtube_module.os, "chmod", lambda *args, **kwargs: None)
+    return sleep
+
+
+@pytest.fixture(scope="class")
+def youtube_account(tmp_path_factory: pytest.TempPathFactory) -> YouTubeAccount:
+    # Per-class paths: xdist workers never share a storage_state/cookies file
+    base = tmp_path_factory.mktemp("account")
     return YouTubeAccount(
         name="primary",
-        storage_state=Path("/tmp/storage_state.json"),
-        cookies_path=Path("/tmp/cookies.txt"),
+        storage_state=base / "storage_state.json",
+        cookies_path=base / "cookies.txt",
         role="primary",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def adapter(youtube_account: YouTubeAccount) -> YouTubeBrowserAdapter:
     delays = {
         "field": (0.1, 0.2),
         "nav": (0.1, 0.2),
         "post": (0.1, 0.2),
     }
-    mock_browser = Mock()
-    return YouTubeBrowserAdapter(youtube_account, browser=mock_browser, delays=delays)
+    return YouTubeBrowserAdapter(youtube_account, browser=Mock(), delays=delays)
+
+
+@pytest.fixture(autouse=True)
+def _reset_adapter(adapter: YouTubeBrowserAdapter) -> Iterator[None]:
+    """Hand the next test a fresh browser and no open context."""
+    yield
+    adapter.browser = Mock()
+    adapter.context = None
 
 
 class TestYouTubeBrowserAdapterInit:
@@ -61,17 +102,19 @@ class TestYouTubeBrowserAdapterInit:
 
 
 class TestRandomDelay:
-    def test_random_delay_applies_delay(self, adapter: YouTubeBrowserAdapter) -> None:
-        with patch("time.sleep") as mock_sleep:
-            adapter._random_delay("field")
-            mock_sleep.assert_called_once()
-            call_args = mock_sleep.call_args[0][0]
-            assert 0.1 <= call_args <= 0.2
+    def test_random_delay_applies_delay(
+        self, adapter: YouTubeBrowserAdapter, fake_sleep: Mock
+    ) -> None:
+        adapter._random_delay("field")
+        fake_sleep.assert_called_once()
+        call_args = fake_sleep.call_args[0][0]
+        assert 0.1 <= call_args <= 0.2
 
-    def test_random_delay_unknown_action_type(self, adapter: YouTubeBrowserAdapter) -> None:
-        with patch("time.sleep") as mock_sleep:
-            adapter._random_delay("unknown")
-            mock_sleep.assert_not_called()
+    def test_random_delay_unknown_action_type(
+        self, adapter: YouTubeBrowserAdapter, fake_sleep: Mock
+    ) -> None:
+        adapter._random_delay("unknown")
+        fake_sleep.assert_not_called()
 
 
 class TestCheckBotDetection:
@@ -243,8 +286,7 @@ class TestClose:
         mock_context = Mock()
         adapter.context = mock_context
         browser = cast(Mock, adapter.browser)
-        with patch("os.chmod"):
-            adapter.close()
+        adapter.close()
         mock_context.storage_state.assert_called_once()
         mock_context.close.assert_called_once()
         # Should NOT call browser.close() — RaidAdapter owns browser
@@ -277,12 +319,7 @@ class TestUpload:
         mock_page = Mock()
         mock_page.url = "https://www.youtube.com/upload"
 
-        def query_selector_side_effect(selector: str) -> Mock | None:
-            if selector == "iframe[src*='recaptcha'], div#captcha-container":
-                return Mock()
-            return None
-
-        mock_page.query_selector.side_effect = query_selector_side_effect
+        mock_page.query_selector.side_effect = {constants.CAPTCHA_INDICATOR: Mock()}.get
         mock_context.new_page.return_value = mock_page
 
         adapter.context = mock_context
@@ -295,12 +332,7 @@ class TestUpload:
         mock_page = Mock()
         mock_page.url = "https://www.youtube.com/upload"
 
-        def query_selector_side_effect(selector: str) -> Mock | None:
-            if selector == "iframe[src*='recaptcha'], div#captcha-container":
-                return None
-            return None
-
-        mock_page.query_selector.side_effect = query_selector_side_effect
+        mock_page.query_selector.return_value = None
         mock_page.wait_for_selector.side_effect = PlaywrightTimeoutError("Selector not found")
         mock_context.new_page.return_value = mock_page
 
@@ -314,46 +346,26 @@ class TestUpload:
         mock_page = Mock()
         mock_page.url = "https://www.youtube.com/upload"
 
-        mock_file_input = Mock()
-        mock_title_input = Mock()
-        mock_not_for_kids = Mock()
-        mock_next_btn = Mock()
-        mock_private_radio = Mock()
-        mock_video_url_elem = Mock()
-        mock_done_btn = Mock()
-
-        mock_video_url_elem.get_attribute.return_value = "https://youtu.be/abc123"
-
-        def query_selector_side_effect(selector: str) -> Mock | None:
-            if selector == "iframe[src*='recaptcha'], div#captcha-container":
-                return None
-            elif selector == "#title-textarea #textbox":
-                return mock_title_input
-            elif selector == "#done-button":
-                return mock_done_btn
-            return None
-
-        def wait_for_selector_side_effect(selector: str, **kwargs: object) -> Mock | None:
-            if selector == constants.UPLOAD_FILE_PICKER:
-                return Mock()
-            elif selector == 'input[type="file"]':
-                return mock_file_input
-            elif selector == "#title-textarea #textbox":
-                return mock_title_input
-            elif selector == 'tp-yt-paper-radio-button[name="VIDEO_MADE_FOR_KIDS_NOT_MFK"]':
-                return mock_not_for_kids
-            elif selector == "#next-button":
-                return mock_next_btn
-            elif selector == 'tp-yt-paper-radio-button[name="PRIVATE"]':
-                return mock_private_radio
-            elif selector == "span.video-url-fadeable a":
-                return mock_video_url_elem
-            elif selector == "tp-yt-iron-overlay-backdrop":
-                return None
-            return None
-
-        mock_page.query_selector.side_effect = query_selector_side_effect
-        mock_page.wait_for_selector.side_effect = wait_for_selector_side_effect
+        title_input = _El()
+        done_btn = _El()
+
+        # Unlisted selectors (captcha, scrim, ...) resolve to None
+        query_selectors = {
+            constants.TITLE_INPUT: title_input,
+            constants.DONE_BUTTON: done_btn,
+        }
+        wait_selectors = {
+            constants.UPLOAD_FILE_PICKER: _El(),
+            constants.FILE_INPUT: _El(),
+            constants.TITLE_INPUT: title_input,
+            constants.NOT_MADE_FOR_KIDS: _El(),
+            constants.NEXT_BUTTON: _El(),
+            constants.PRIVATE_RADIO: _El(),
+            constants.VIDEO_URL_ELEMENT: _El(href="https://youtu.be/abc123"),
+        }
+
+        mock_page.query_selector.side_effect = query_selectors.get
+        mock_page.wait_for_selector.side_effect = lambda selector, **_: wait_selectors.get(selector)
         mock_page.wait_for_function.return_value = None
         mock_context.new_page.return_value = mock_page
 
@@ -458,31 +470,16 @@ class TestAssignPlaylist:
         mock_done_btn = Mock()
         mock_page_save_btn = Mock()
 
-        def wait_for_selector_side_effect(selector: str, **kwargs: object) -> Mock | None:
-            if (
-                selector
-                == 'ytcp-video-metadata-playlists ytcp-dropdown-trigger[aria-label="Select playlists"]'
-            ):
-                return mock_playlist_trigger
-            elif selector == "ytcp-playlist-dialog input#search-input":
-                return mock_search_input
-            elif selector == '#items tp-yt-paper-checkbox:has-text("my-playlist")':
-                return mock_playlist_item
-            elif selector == "ytcp-button.done-button":
-                return mock_done_btn
-            elif selector == "ytcp-button#save":
-                return mock_page_save_btn
-            elif selector == "iframe[src*='recaptcha'], div#captcha-container":
-                return None
-            return None
+        wait_selectors = {
+            constants.PLAYLIST_TRIGGER: mock_playlist_trigger,
+            constants.PLAYLIST_SEARCH_INPUT: mock_search_input,
+            constants.PLAYLIST_ITEM_TEMPLATE.format(name="my-playlist"): mock_playlist_item,
+            constants.PLAYLIST_DONE: mock_done_btn,
+            constants.PLAYLIST_PAGE_SAVE: mock_page_save_btn,
+        }
 
-        def query_selector_side_effect(selector: str) -> Mock | None:
-            if selector == "iframe[src*='recaptcha'], div#captcha-container":
-                return None
-            return None
-
-        mock_page.wait_for_selector.side_effect = wait_for_selector_side_effect
-        mock_page.query_selector.side_effect = query_selector_side_effect
+        mock_page.wait_for_selector.side_effect = lambda selector, **_: wait_selectors.get(selector)
+        mock_page.query_selector.return_value = None
         mock_page.wait_for_function.return_value = None
         mock_context.new_page.return_value = mock_page
 